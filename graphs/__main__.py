@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+WifiObserver Graph Generator
+
+This module exposes every chart generator as a subcommand of a single CLI so
+that a pipeline building several charts imports matplotlib and numpy (and
+builds the font cache) only once.
+
+Usage: python -m graphs {discovery,types,signal,all} [options]
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path to enable imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Point matplotlib at the shared config directory before importing it
+from graphs._mpl import use_file_backend
+
+from graphs import discovery_efficiency, network_types, signal_strength
+from graphs._common import DEFAULT_DPI
+
+# Subcommand name -> (chart module, help text)
+COMMANDS = {
+    "discovery": (discovery_efficiency, "Discovery efficiency comparison chart"),
+    "types": (network_types, "Network type distribution chart"),
+    "signal": (signal_strength, "Signal strength chart")
+}
+
+
+def add_all_arguments(parser):
+    """Register the command line options for building every chart
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
+    parser.add_argument("--input", "-i", required=True, help="Input JSON file with network data")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Output image resolution")
+    parser.add_argument("--max", "-m", type=int, default=20, help="Maximum number of networks in the signal chart")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse renderings of identical data from this directory (e.g. graphs/_cache)")
+
+
+def run_all(args):
+    """Generate every chart in this process using default output names
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    for module, _ in COMMANDS.values():
+        module.run(argparse.Namespace(input=args.input, output=None, dpi=args.dpi, max=args.max,
+                                      cache_dir=args.cache_dir))
+
+
+def main():
+    """Main function for the combined graph generator"""
+    parser = argparse.ArgumentParser(description="WifiObserver - Graph Generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    # Register one subcommand per chart
+    for name, (module, help_text) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        module.add_arguments(subparser)
+        subparser.set_defaults(func=module.run)
+    
+    # Register the subcommand that builds every chart
+    subparser = subparsers.add_parser("all", help="Generate every chart from one input file")
+    add_all_arguments(subparser)
+    subparser.set_defaults(func=run_all)
+    
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    use_file_backend()
+    main()
\ No newline at end of file
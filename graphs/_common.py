@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared Graph Helpers
+
+This module holds the plotting helpers shared by the WifiObserver graph
+generator scripts.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from types import MappingProxyType
+
+import matplotlib.pyplot as plt
+
+# Network types in classifier priority order
+CANONICAL_TYPES = (
+    "POSSIBLE_OFFICIAL",
+    "ENTERPRISE",
+    "MOBILE_HOTSPOT",
+    "PUBLIC",
+    "IOT",
+    "ISP_PROVIDED",
+    "STANDARD"
+)
+
+# Chart colors for each network type, shared by all graph scripts
+NETWORK_COLORS = MappingProxyType({
+    "POSSIBLE_OFFICIAL": "firebrick",
+    "ENTERPRISE": "royalblue",
+    "MOBILE_HOTSPOT": "forestgreen",
+    "PUBLIC": "gold",
+    "IOT": "purple",
+    "ISP_PROVIDED": "turquoise",
+    "STANDARD": "lightgray"
+})
+
+# Fallback color for unrecognized network types
+DEFAULT_COLOR = "lightgray"
+
+# "Generated" stamp for charts, formatted once per process
+TIMESTAMP = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# Default output resolution; 150 dpi is plenty for on-screen reports
+DEFAULT_DPI = 150
+
+# Renderer settings for charts that may draw hundreds of artists
+LARGE_CHART_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000
+}
+
+# Favour encode speed over file size for PNG output
+PNG_PIL_KWARGS = {"compress_level": 3, "optimize": False}
+
+
+def render_cache_path(cache_dir, key_data, output_file, dpi=DEFAULT_DPI):
+    """Build the render cache file path for a chart
+
+    Args:
+        cache_dir (str): Render cache directory, or None to disable caching
+        key_data: JSON-serializable data that fully determines the chart
+        output_file (str): Output file path
+        dpi (int, optional): Output resolution. Defaults to DEFAULT_DPI.
+
+    Returns:
+        str: Cache file path, or None if caching is disabled
+    """
+    if not cache_dir or not output_file:
+        return None
+    
+    # Key on the chart data, resolution and output format
+    payload = json.dumps([key_data, dpi], sort_keys=True, default=str)
+    key = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    extension = os.path.splitext(output_file)[1].lower()
+    
+    return os.path.join(cache_dir, key + extension)
+
+
+def restore_cached_render(cache_file, output_file):
+    """Copy a cached rendering to the output file if one exists
+
+    Args:
+        cache_file (str): Cache file path, or None if caching is disabled
+        output_file (str): Output file path
+
+    Returns:
+        bool: True if the output was restored from the cache
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return False
+    
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    shutil.copyfile(cache_file, output_file)
+    return True
+
+
+def save_figure(output_file, dpi=DEFAULT_DPI, cache_file=None):
+    """Save the current figure to a file, creating its directory if needed
+
+    Args:
+        output_file (str): Output file path
+        dpi (int, optional): Output resolution. Defaults to DEFAULT_DPI.
+        cache_file (str, optional): Render cache path to store a copy at
+    """
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    kwargs = {}
+    if output_file.lower().endswith(".png"):
+        kwargs["pil_kwargs"] = PNG_PIL_KWARGS
+        kwargs["metadata"] = {"Software": None}
+    
+    plt.savefig(output_file, dpi=dpi, **kwargs)
+    
+    # Keep a copy for later runs with identical data
+    if cache_file:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        shutil.copyfile(output_file, cache_file)
+    
+    # Release the figure so several charts can be built in one process
+    plt.close()
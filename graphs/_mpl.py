@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Matplotlib Setup
+
+This module holds the matplotlib configuration shared by the WifiObserver
+command line tools, which only ever write charts to files. Entry points
+import it before matplotlib so the config directory is set in time.
+"""
+
+import os
+
+# Keep matplotlib's config and font cache beside the graph scripts so it survives fresh environments
+os.environ.setdefault("MPLCONFIGDIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "_mpl_cache"))
+
+import matplotlib
+
+
+def use_file_backend():
+    """Select the non-interactive Agg backend so the CLIs skip interactive backend probing"""
+    matplotlib.use("Agg")
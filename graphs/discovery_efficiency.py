@@ -13,20 +13,51 @@ import argparse
 import json
 import os
 import sys
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime
 
 # Add parent directory to path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Point matplotlib at the shared config directory before importing it
+from graphs._mpl import use_file_backend
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from graphs._common import DEFAULT_DPI, TIMESTAMP, render_cache_path, restore_cached_render, save_figure
+
+# Static annotation text, built once at import
+EXPLANATIONS = [
+    "Discovers all networks\nin range including hidden\nnetworks automatically",
+    "Identifies hidden networks\nwithout manual probing\nor specialized tools",
+    "Automatically classifies\nnetworks based on\ncharacteristics"
+]
+
+BENEFITS_TEXT = "\n".join([
+    "Additional Benefits of WifiObserver:",
+    "• Passive scanning only - no packets sent to networks",
+    "• Automatic reporting and visualization",
+    "• Legal compliance built-in by design",
+    "• Consistent, repeatable methodology",
+    "• Easy-to-interpret network classification"
+])
 
-def create_discovery_efficiency_chart(output_file=None):
+DISCLAIMER = "Note: Times are estimates based on typical usage patterns. Actual efficiency may vary based on hardware and environment."
+
+
+def create_discovery_efficiency_chart(output_file=None, dpi=DEFAULT_DPI, cache_dir=None):
     """Create a bar chart showing the efficiency comparison
 
     Args:
         output_file (str, optional): Output file path. If None, display the chart.
+        dpi (int, optional): Output resolution. Defaults to DEFAULT_DPI.
+        cache_dir (str, optional): Render cache directory. Defaults to None (no caching).
     """
+    # The chart content is static, so it only needs rendering once
+    cache_file = render_cache_path(cache_dir, ["discovery"], output_file, dpi)
+    if restore_cached_render(cache_file, output_file):
+        print(f"Chart saved to {output_file}")
+        return
+    
     # Set up the data
     categories = ["Time to Discover\nAll Networks", "Hidden Network\nDetection", "Network Type\nClassification"]
     
@@ -48,30 +79,18 @@ def create_discovery_efficiency_chart(output_file=None):
                                color='royalblue', edgecolor='black', linewidth=0.5)
     
     # Add value labels above the bars
-    def add_labels(bars):
-        for bar in bars:
-            height = bar.get_height()
-            ax.annotate(f'{height} min',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),  # 3 points vertical offset
-                        textcoords="offset points",
-                        ha='center', va='bottom',
-                        fontweight='bold')
-    
-    add_labels(manual_bars)
-    add_labels(wifiobserver_bars)
-    
-    # Add efficiency improvement percentages
-    for i, (m, w) in enumerate(zip(manual_times, wifiobserver_times)):
-        improvement = ((m - w) / m) * 100
-        ax.annotate(f'{improvement:.0f}% faster',
-                   xy=(x[i], w + 0.5),
-                   xytext=(0, 10),  # 10 points vertical offset
-                   textcoords="offset points",
-                   ha='center', va='bottom',
-                   color='green',
-                   fontweight='bold',
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8, edgecolor='green'))
+    ax.bar_label(manual_bars, fmt='%d min', padding=3, fontweight='bold')
+    ax.bar_label(wifiobserver_bars, fmt='%d min', padding=3, fontweight='bold')
+    
+    # Add efficiency improvement percentages above the WifiObserver bars
+    manual = np.array(manual_times)
+    improvements = (manual - np.array(wifiobserver_times)) / manual * 100
+    ax.bar_label(wifiobserver_bars,
+                 labels=[f'{improvement:.0f}% faster' for improvement in improvements],
+                 padding=22,  # Clear the value label below
+                 color='green',
+                 fontweight='bold',
+                 bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8, edgecolor='green'))
     
     # Customize the chart
     ax.set_title('Network Discovery Efficiency Comparison', fontsize=16, fontweight='bold', pad=20)
@@ -87,13 +106,7 @@ def create_discovery_efficiency_chart(output_file=None):
     ax.set_ylim(0, max(manual_times) * 1.2)
     
     # Add explanatory annotations
-    explanations = [
-        "Discovers all networks\nin range including hidden\nnetworks automatically",
-        "Identifies hidden networks\nwithout manual probing\nor specialized tools",
-        "Automatically classifies\nnetworks based on\ncharacteristics"
-    ]
-    
-    for i, explanation in enumerate(explanations):
+    for i, explanation in enumerate(EXPLANATIONS):
         ax.annotate(explanation,
                    xy=(x[i], 0.5),
                    xytext=(0, -30),  # 30 points vertical offset
@@ -104,60 +117,59 @@ def create_discovery_efficiency_chart(output_file=None):
                    bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow", alpha=0.8))
     
     # Add additional benefits section
-    benefits_text = "\n".join([
-        "Additional Benefits of WifiObserver:",
-        "• Passive scanning only - no packets sent to networks",
-        "• Automatic reporting and visualization",
-        "• Legal compliance built-in by design",
-        "• Consistent, repeatable methodology",
-        "• Easy-to-interpret network classification"
-    ])
-    
-    plt.figtext(0.7, 0.2, benefits_text, fontsize=10, 
+    plt.figtext(0.98, 0.2, BENEFITS_TEXT, ha="right", multialignment="left", fontsize=10, 
                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.3))
     
     # Add timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    plt.figtext(0.5, 0.01, f"Generated: {timestamp}", ha="center", fontsize=9, style='italic')
+    plt.figtext(0.5, 0.01, f"Generated: {TIMESTAMP}", ha="center", fontsize=9, style='italic')
     
     # Disclaimer
-    disclaimer = "Note: Times are estimates based on typical usage patterns. Actual efficiency may vary based on hardware and environment."
-    plt.figtext(0.5, 0.04, disclaimer, ha="center", fontsize=8, style='italic')
+    plt.figtext(0.5, 0.04, DISCLAIMER, ha="center", fontsize=8, style='italic')
     
-    # Tight layout
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.1)
+    # Fixed margins, so saving needs no extra layout pass
+    fig.subplots_adjust(left=0.08, right=0.95, top=0.9, bottom=0.1)
     
     # Save or display
     if output_file:
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        plt.savefig(output_file, bbox_inches='tight', dpi=300)
+        save_figure(output_file, dpi, cache_file)
         print(f"Chart saved to {output_file}")
     else:
         plt.show()
 
 
-def main():
-    """Main function for the discovery efficiency graph generator"""
-    parser = argparse.ArgumentParser(description="WifiObserver - Discovery Efficiency Chart Generator")
+def add_arguments(parser):
+    """Register the command line options for this chart
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
     parser.add_argument("--output", "-o", default=None, help="Output image file (PNG/PDF/SVG)")
-    args = parser.parse_args()
-    
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Output image resolution")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse renderings of identical data from this directory (e.g. graphs/_cache)")
+
+
+def run(args):
+    """Generate the chart from parsed command line arguments
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Default output filename if not specified
     if not args.output:
         args.output = "graphs/discovery_efficiency.png"
     
-    # Ensure output directory exists
-    output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
     # Create chart
-    create_discovery_efficiency_chart(args.output)
+    create_discovery_efficiency_chart(args.output, args.dpi, args.cache_dir)
+
+
+def main():
+    """Main function for the discovery efficiency graph generator"""
+    parser = argparse.ArgumentParser(description="WifiObserver - Discovery Efficiency Chart Generator")
+    add_arguments(parser)
+    run(parser.parse_args())
 
 
 if __name__ == "__main__":
+    use_file_backend()
     main()
\ No newline at end of file
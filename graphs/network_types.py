@@ -10,16 +10,38 @@ classifications in a given scanning session.
 """
 
 import argparse
-import json
 import os
 import sys
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime
 
 # Add parent directory to path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Point matplotlib at the shared config directory before importing it
+from graphs._mpl import use_file_backend
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from src.utils.json_utils import load_json
+from graphs._common import (CANONICAL_TYPES, DEFAULT_COLOR, DEFAULT_DPI, NETWORK_COLORS, TIMESTAMP,
+                            render_cache_path, restore_cached_render, save_figure)
+
+# Static classification legend, built once at import
+INFO_TEXT = "\n".join([
+    "Network Type Classifications:",
+    "POSSIBLE_OFFICIAL: Networks with characteristics of government/official entities",
+    "ENTERPRISE: Corporate or organizational networks",
+    "MOBILE_HOTSPOT: Personal mobile hotspots from phones or mobile devices",
+    "PUBLIC: Open access points or public service networks",
+    "IOT: Networks associated with Internet of Things devices",
+    "ISP_PROVIDED: Default configurations from Internet Service Providers",
+    "STANDARD: Networks that don't fit other classifications"
+])
+
+# Histogram bin for each network type; unrecognized types fall into STANDARD
+TYPE_CODES = {name: code for code, name in enumerate(CANONICAL_TYPES)}
+STANDARD_CODE = TYPE_CODES["STANDARD"]
+
 
 def load_data(input_file):
     """Load network data from a JSON file
@@ -31,8 +53,7 @@ def load_data(input_file):
         dict: Loaded data
     """
     try:
-        with open(input_file, "r") as f:
-            data = json.load(f)
+        data = load_json(input_file)
         
         # Check if we have a proper data structure
         if "networks" in data:
@@ -65,34 +86,35 @@ def calculate_distribution(data):
     if "distribution" in data:
         return data["distribution"]
     
-    # Calculate distribution from networks
-    distribution = {
-        "POSSIBLE_OFFICIAL": 0,
-        "ENTERPRISE": 0,
-        "MOBILE_HOTSPOT": 0,
-        "PUBLIC": 0,
-        "IOT": 0,
-        "ISP_PROVIDED": 0,
-        "STANDARD": 0
-    }
-    
-    for network in data["networks"]:
-        network_type = network.get("type", "STANDARD")
-        if network_type in distribution:
-            distribution[network_type] += 1
-        else:
-            distribution["STANDARD"] += 1
+    # Encode each network type as a small integer code
+    networks = data["networks"]
+    codes = np.fromiter(
+        (TYPE_CODES.get(network.get("type", "STANDARD"), STANDARD_CODE) for network in networks),
+        dtype=np.int8,
+        count=len(networks)
+    )
+    
+    # Tally all codes in a single histogram pass
+    counts = np.bincount(codes, minlength=len(CANONICAL_TYPES))
     
-    return distribution
+    return dict(zip(CANONICAL_TYPES, counts.tolist()))
 
 
-def create_network_types_chart(distribution, output_file=None):
+def create_network_types_chart(distribution, output_file=None, dpi=DEFAULT_DPI, cache_dir=None):
     """Create a pie chart of network types distribution
 
     Args:
         distribution (dict): Network type distribution
         output_file (str, optional): Output file path. If None, display the chart.
+        dpi (int, optional): Output resolution. Defaults to DEFAULT_DPI.
+        cache_dir (str, optional): Render cache directory. Defaults to None (no caching).
     """
+    # Reuse a previous rendering of the same distribution
+    cache_file = render_cache_path(cache_dir, ["types", distribution], output_file, dpi)
+    if restore_cached_render(cache_file, output_file):
+        print(f"Chart saved to {output_file}")
+        return
+    
     # Filter out zero values
     filtered_distribution = {k: v for k, v in distribution.items() if v > 0}
     
@@ -100,28 +122,16 @@ def create_network_types_chart(distribution, output_file=None):
         print("No data to display.")
         return
     
-    # Set up colors for different network types
-    colors = {
-        "POSSIBLE_OFFICIAL": "firebrick",
-        "ENTERPRISE": "royalblue",
-        "MOBILE_HOTSPOT": "forestgreen",
-        "PUBLIC": "gold",
-        "IOT": "purple",
-        "ISP_PROVIDED": "turquoise",
-        "STANDARD": "lightgray"
-    }
-    
     # Set up chart
-    plt.figure(figsize=(12, 7))
+    plt.figure(figsize=(12, 9))
     
     # Extract data
-    labels = filtered_distribution.keys()
-    sizes = filtered_distribution.values()
-    chart_colors = [colors.get(label, "lightgray") for label in labels]
+    labels = list(filtered_distribution.keys())
+    sizes = np.fromiter(filtered_distribution.values(), dtype=np.int64, count=len(labels))
+    chart_colors = [NETWORK_COLORS.get(label, DEFAULT_COLOR) for label in labels]
     
-    # Calculate percentages for labels
-    total = sum(sizes)
-    pct_sizes = [(size / total) * 100 for size in sizes]
+    # Calculate percentages for labels in one vectorized step
+    pct_sizes = sizes * (100.0 / sizes.sum())
     
     # Create pie chart
     patches, texts, autotexts = plt.pie(
@@ -130,7 +140,6 @@ def create_network_types_chart(distribution, output_file=None):
         colors=chart_colors,
         autopct='%1.1f%%',
         startangle=90,
-        shadow=True,
         wedgeprops={'edgecolor': 'black', 'linewidth': 0.5},
         textprops={'fontsize': 12, 'fontweight': 'bold'}
     )
@@ -143,61 +152,52 @@ def create_network_types_chart(distribution, output_file=None):
     plt.suptitle('Based on WifiObserver Classification', fontsize=10, y=0.92)
     
     # Add timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    plt.figtext(0.5, 0.01, f"Generated: {timestamp}", ha="center", fontsize=9, style='italic')
+    plt.figtext(0.5, 0.01, f"Generated: {TIMESTAMP}", ha="center", fontsize=9, style='italic')
     
     # Add legend
-    legend_labels = [f"{label} ({int(pct)}%)" for label, pct in zip(labels, pct_sizes)]
-    plt.legend(patches, legend_labels, loc="center left", bbox_to_anchor=(1, 0.5))
+    legend_labels = np.char.add(np.char.add(np.array(labels), " ("),
+                                np.char.add(pct_sizes.astype(np.int64).astype(str), "%)"))
+    plt.legend(patches, legend_labels.tolist(), loc="center left", bbox_to_anchor=(1, 0.5))
     
     # Add descriptive information
-    info_text = "\n".join([
-        "Network Type Classifications:",
-        "POSSIBLE_OFFICIAL: Networks with characteristics of government/official entities",
-        "ENTERPRISE: Corporate or organizational networks",
-        "MOBILE_HOTSPOT: Personal mobile hotspots from phones or mobile devices",
-        "PUBLIC: Open access points or public service networks",
-        "IOT: Networks associated with Internet of Things devices",
-        "ISP_PROVIDED: Default configurations from Internet Service Providers",
-        "STANDARD: Networks that don't fit other classifications"
-    ])
-    
-    plt.figtext(0.5, -0.1, info_text, ha="center", fontsize=9, 
+    plt.figtext(0.5, 0.04, INFO_TEXT, ha="center", va="bottom", fontsize=9, 
                bbox=dict(boxstyle="round,pad=0.5", facecolor="white", alpha=0.8))
     
-    # Adjust layout
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.1)
+    # Fixed margins keep the legend and information box inside the figure
+    plt.subplots_adjust(left=0.05, right=0.75, top=0.85, bottom=0.3)
     
     # Save or display
     if output_file:
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        plt.savefig(output_file, bbox_inches='tight', dpi=300)
+        save_figure(output_file, dpi, cache_file)
         print(f"Chart saved to {output_file}")
     else:
         plt.show()
 
 
-def main():
-    """Main function for the network types graph generator"""
-    parser = argparse.ArgumentParser(description="WifiObserver - Network Types Distribution Chart Generator")
+def add_arguments(parser):
+    """Register the command line options for this chart
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
     parser.add_argument("--input", "-i", required=True, help="Input JSON file with network data")
     parser.add_argument("--output", "-o", default=None, help="Output image file (PNG/PDF/SVG)")
-    args = parser.parse_args()
-    
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Output image resolution")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse renderings of identical data from this directory (e.g. graphs/_cache)")
+
+
+def run(args):
+    """Generate the chart from parsed command line arguments
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Default output filename if not specified
     if not args.output:
         input_base = os.path.splitext(os.path.basename(args.input))[0]
         args.output = f"graphs/network_types_{input_base}.png"
     
-    # Ensure output directory exists
-    output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
     # Load data
     data = load_data(args.input)
     
@@ -205,8 +205,16 @@ def main():
     distribution = calculate_distribution(data)
     
     # Create chart
-    create_network_types_chart(distribution, args.output)
+    create_network_types_chart(distribution, args.output, args.dpi, args.cache_dir)
+
+
+def main():
+    """Main function for the network types graph generator"""
+    parser = argparse.ArgumentParser(description="WifiObserver - Network Types Distribution Chart Generator")
+    add_arguments(parser)
+    run(parser.parse_args())
 
 
 if __name__ == "__main__":
+    use_file_backend()
     main()
\ No newline at end of file
@@ -9,16 +9,33 @@ of detected networks, color-coded by network type for easy visualization.
 """
 
 import argparse
-import json
 import os
 import sys
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime
 
 # Add parent directory to path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Point matplotlib at the shared config directory before importing it
+from graphs._mpl import use_file_backend
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from src.utils.json_utils import load_json
+from graphs._common import (DEFAULT_COLOR, DEFAULT_DPI, LARGE_CHART_RC, NETWORK_COLORS, TIMESTAMP,
+                            render_cache_path, restore_cached_render, save_figure)
+
+# Static interpretation guide, built once at import
+GUIDE_TEXT = "\n".join([
+    "Signal Strength Interpretation:",
+    "-30 to -50 dBm: Excellent signal (Very close to AP)",
+    "-50 to -60 dBm: Good signal (Reliable connection)",
+    "-60 to -70 dBm: Fair signal (Acceptable performance)",
+    "-70 to -80 dBm: Weak signal (May experience issues)",
+    "-80 to -90 dBm: Poor signal (Unreliable connection)",
+    "Below -90 dBm: Very poor (Barely detectable)"
+])
+
 
 def load_data(input_file):
     """Load network data from a JSON file
@@ -30,8 +47,7 @@ def load_data(input_file):
         list: List of networks
     """
     try:
-        with open(input_file, "r") as f:
-            data = json.load(f)
+        data = load_json(input_file)
         
         # Handle different file structures
         if "networks" in data:
@@ -59,22 +75,34 @@ def prepare_signal_data(networks, max_networks=20):
     Returns:
         tuple: (ssids, signal_strengths, types)
     """
-    # Filter out networks without signal strength data
-    valid_networks = [n for n in networks if "signal" in n and isinstance(n["signal"], (int, float))]
-    
-    # Sort by signal strength (strongest first)
-    sorted_networks = sorted(valid_networks, key=lambda n: n.get("signal", -100), reverse=True)
+    # Collect networks with signal strength data and their signals in one pass
+    valid_networks = []
+    signal_values = []
+    for network in networks:
+        signal = network.get("signal")
+        if isinstance(signal, (int, float)):
+            valid_networks.append(network)
+            signal_values.append(signal)
+    
+    # Partition out the networks at least as strong as the max_networks-th strongest, ties included
+    order = -np.array(signal_values, dtype=np.float64)
+    if 0 < max_networks < len(order):
+        kth = order[np.argpartition(order, max_networks - 1)[max_networks - 1]]
+        candidates = np.flatnonzero(~(order > kth))
+    else:
+        candidates = np.arange(len(order))
     
-    # Limit to max_networks
-    if len(sorted_networks) > max_networks:
-        sorted_networks = sorted_networks[:max_networks]
+    # Sort only the candidates; the stable sort keeps input order among equal signals
+    top_idx = candidates[np.argsort(order[candidates], kind="stable")][:max_networks]
     
-    # Prepare data
+    # Prepare data for the selected networks only
     ssids = []
     signal_strengths = []
     types = []
     
-    for network in sorted_networks:
+    for i in top_idx:
+        network = valid_networks[i]
+        
         # Use SSID if available, otherwise BSSID
         ssid = network.get("ssid", network.get("bssid", "Unknown"))
         if ssid == "[Hidden Network]" and "bssid" in network:
@@ -85,19 +113,22 @@ def prepare_signal_data(networks, max_networks=20):
             ssid = ssid[:17] + "..."
         
         ssids.append(ssid)
-        signal_strengths.append(network.get("signal", -100))
+        signal_strengths.append(signal_values[i])
         types.append(network.get("type", "STANDARD"))
     
     return ssids, signal_strengths, types
 
 
-def create_signal_strength_chart(networks, output_file=None, max_networks=20):
+@plt.rc_context(LARGE_CHART_RC)
+def create_signal_strength_chart(networks, output_file=None, max_networks=20, dpi=DEFAULT_DPI, cache_dir=None):
     """Create a bar chart of signal strengths
 
     Args:
         networks (list): List of networks
         output_file (str, optional): Output file path. If None, display the chart.
         max_networks (int, optional): Maximum number of networks to display. Defaults to 20.
+        dpi (int, optional): Output resolution. Defaults to DEFAULT_DPI.
+        cache_dir (str, optional): Render cache directory. Defaults to None (no caching).
     """
     # Prepare data
     ssids, signal_strengths, types = prepare_signal_data(networks, max_networks)
@@ -106,18 +137,14 @@ def create_signal_strength_chart(networks, output_file=None, max_networks=20):
         print("No signal data available.")
         return
     
+    # Reuse a previous rendering of the same bars
+    cache_file = render_cache_path(cache_dir, ["signal", ssids, signal_strengths, types], output_file, dpi)
+    if restore_cached_render(cache_file, output_file):
+        print(f"Chart saved to {output_file}")
+        return
+    
     # Set up colors based on network type
-    color_map = {
-        "POSSIBLE_OFFICIAL": "firebrick",
-        "ENTERPRISE": "royalblue",
-        "MOBILE_HOTSPOT": "forestgreen",
-        "PUBLIC": "gold",
-        "IOT": "purple",
-        "ISP_PROVIDED": "turquoise",
-        "STANDARD": "lightgray"
-    }
-    
-    colors = [color_map.get(t, "lightgray") for t in types]
+    colors = [NETWORK_COLORS.get(t, DEFAULT_COLOR) for t in types]
     
     # Set up chart
     plt.figure(figsize=(10, max(8, len(ssids) * 0.4)))
@@ -158,67 +185,66 @@ def create_signal_strength_chart(networks, output_file=None, max_networks=20):
     
     # Add legend
     unique_types = list(set(types))
-    legend_handles = [plt.Rectangle((0,0), 1, 1, color=color_map.get(t, "lightgray")) for t in unique_types]
+    legend_handles = [plt.Rectangle((0,0), 1, 1, color=NETWORK_COLORS.get(t, DEFAULT_COLOR)) for t in unique_types]
     plt.legend(legend_handles, unique_types, loc='lower right', fontsize=10)
     
     # Add timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    plt.figtext(0.5, 0.01, f"Generated: {timestamp}", ha="center", fontsize=9, style='italic')
+    plt.figtext(0.5, 0.01, f"Generated: {TIMESTAMP}", ha="center", fontsize=9, style='italic')
     
     # Add signal strength interpretation guide
-    guide_text = "\n".join([
-        "Signal Strength Interpretation:",
-        "-30 to -50 dBm: Excellent signal (Very close to AP)",
-        "-50 to -60 dBm: Good signal (Reliable connection)",
-        "-60 to -70 dBm: Fair signal (Acceptable performance)",
-        "-70 to -80 dBm: Weak signal (May experience issues)",
-        "-80 to -90 dBm: Poor signal (Unreliable connection)",
-        "Below -90 dBm: Very poor (Barely detectable)"
-    ])
-    
-    plt.figtext(0.02, 0.02, guide_text, fontsize=9, 
+    plt.figtext(0.02, 0.02, GUIDE_TEXT, fontsize=9, 
                bbox=dict(boxstyle="round,pad=0.5", facecolor="white", alpha=0.8))
     
-    # Tight layout
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.15)
+    # Fixed margins leave room for the SSID labels and titles without an extra layout pass
+    plt.subplots_adjust(left=0.22, right=0.95, top=0.84, bottom=0.15)
     
     # Save or display
     if output_file:
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        plt.savefig(output_file, bbox_inches='tight', dpi=300)
+        save_figure(output_file, dpi, cache_file)
         print(f"Chart saved to {output_file}")
     else:
         plt.show()
 
 
-def main():
-    """Main function for the signal strength graph generator"""
-    parser = argparse.ArgumentParser(description="WifiObserver - Signal Strength Chart Generator")
+def add_arguments(parser):
+    """Register the command line options for this chart
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
     parser.add_argument("--input", "-i", required=True, help="Input JSON file with network data")
     parser.add_argument("--output", "-o", default=None, help="Output image file (PNG/PDF/SVG)")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Output image resolution")
     parser.add_argument("--max", "-m", type=int, default=20, help="Maximum number of networks to display")
-    args = parser.parse_args()
-    
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse renderings of identical data from this directory (e.g. graphs/_cache)")
+
+
+def run(args):
+    """Generate the chart from parsed command line arguments
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Default output filename if not specified
     if not args.output:
         input_base = os.path.splitext(os.path.basename(args.input))[0]
         args.output = f"graphs/signal_strength_{input_base}.png"
     
-    # Ensure output directory exists
-    output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
     # Load data
     networks = load_data(args.input)
     
     # Create chart
-    create_signal_strength_chart(networks, args.output, args.max)
+    create_signal_strength_chart(networks, args.output, args.max, args.dpi, args.cache_dir)
+
+
+def main():
+    """Main function for the signal strength graph generator"""
+    parser = argparse.ArgumentParser(description="WifiObserver - Signal Strength Chart Generator")
+    add_arguments(parser)
+    run(parser.parse_args())
 
 
 if __name__ == "__main__":
+    use_file_backend()
     main()
\ No newline at end of file
@@ -10,16 +10,27 @@ to identify different types of networks.
 """
 
 import argparse
-import json
 import os
 import sys
 import time
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Add parent directory to path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.wifi_scanner import initialize_scan, process_packet
+from src.wifi_scanner import initialize_scan, process_packet, process_packet_raw
+from src.utils import raw_capture
+from src.utils.json_utils import dump_json, dump_json_records, load_json
 from src.utils.logging_utils import setup_logger, log_header, print_network_summary
 
 # Initialize logger
@@ -68,6 +79,208 @@ MANUFACTURER_TYPES = {
     "IOT": ["NEST", "RING", "ECOBEE", "WYZE", "SONOS", "ROKU", "AMAZON"]
 }
 
+# Patterns are matched against uppercased SSIDs and manufacturers, so store them uppercased as tuples
+NETWORK_TYPES = {
+    network_type: {
+        "ssid_patterns": tuple(pattern.upper() for pattern in type_data["ssid_patterns"]),
+        "characteristics": tuple(type_data["characteristics"])
+    }
+    for network_type, type_data in NETWORK_TYPES.items()
+}
+MANUFACTURER_TYPES = {
+    mfg_type: tuple(mfg.upper() for mfg in mfg_list)
+    for mfg_type, mfg_list in MANUFACTURER_TYPES.items()
+}
+
+# Network types in tie-break priority order, and each type's score column
+TYPE_PRIORITY = ("POSSIBLE_OFFICIAL", "ENTERPRISE", "MOBILE_HOTSPOT",
+                 "PUBLIC", "IOT", "ISP_PROVIDED", "STANDARD")
+TYPE_INDEX = {network_type: index for index, network_type in enumerate(TYPE_PRIORITY)}
+
+# Explanatory note attached to each classification
+CLASSIFICATION_NOTES = {
+    "POSSIBLE_OFFICIAL": "This network has characteristics consistent with official/government networks. This is a heuristic classification only and should be verified.",
+    "ENTERPRISE": "This network appears to be an enterprise/corporate network based on its characteristics.",
+    "MOBILE_HOTSPOT": "This network appears to be a mobile hotspot or temporary network.",
+    "PUBLIC": "This network appears to be a public access point.",
+    "IOT": "This network appears to be associated with IoT devices.",
+    "ISP_PROVIDED": "This network appears to be an ISP-provided default configuration."
+}
+
+# Terminal color codes for each classification
+TYPE_COLORS = {
+    "POSSIBLE_OFFICIAL": "\033[91m",  # Red
+    "ENTERPRISE": "\033[94m",  # Blue
+    "MOBILE_HOTSPOT": "\033[92m",  # Green
+    "PUBLIC": "\033[93m",  # Yellow
+    "IOT": "\033[95m",  # Purple
+    "ISP_PROVIDED": "\033[96m"  # Cyan
+}
+
+# Integer codes for the encryption values that affect scoring; all others are 0
+ENCRYPTION_CODES = {"Open": 1, "WPA2/WPA3": 2}
+
+# String fields that repeat across many networks, interned on load so duplicates share one object
+INTERNED_FIELDS = ("bssid", "ssid", "encryption", "manufacturer")
+
+# Score added to a network type for each of its SSID patterns found
+SSID_PATTERN_WEIGHT = 4
+
+# Score bumps for each manufacturer category
+MANUFACTURER_SCORES = {
+    "GOVERNMENT": (("POSSIBLE_OFFICIAL", 4),),
+    "ENTERPRISE": (("ENTERPRISE", 3),),
+    "CONSUMER": (("STANDARD", 2), ("ISP_PROVIDED", 1)),
+    "MOBILE": (("MOBILE_HOTSPOT", 4),),
+    "IOT": (("IOT", 4),)
+}
+
+
+def build_pattern_automaton(pattern_scores):
+    """Build an Aho-Corasick automaton matching every pattern in one pass
+
+    Args:
+        pattern_scores (dict): Score bumps for each pattern
+
+    Returns:
+        ahocorasick.Automaton: Automaton yielding (pattern, bumps) values, or None if unavailable
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, bumps in pattern_scores.items():
+        automaton.add_word(pattern, (pattern, tuple(bumps)))
+    automaton.make_automaton()
+    
+    return automaton
+
+
+def group_pattern_scores(entries):
+    """Group score bumps by pattern
+
+    Args:
+        entries (iterable): (pattern, bumps) pairs, bumps given as (network_type, weight)
+
+    Returns:
+        dict: Score bumps for each pattern, as (score column, weight) pairs
+    """
+    pattern_scores = {}
+    for pattern, bumps in entries:
+        pattern_scores.setdefault(pattern, []).extend((TYPE_INDEX[t], w) for t, w in bumps)
+    
+    return pattern_scores
+
+
+# Score bumps for each SSID pattern and manufacturer name
+SSID_PATTERN_SCORES = group_pattern_scores(
+    (pattern, ((network_type, SSID_PATTERN_WEIGHT),))
+    for network_type, type_data in NETWORK_TYPES.items()
+    for pattern in type_data["ssid_patterns"]
+)
+MANUFACTURER_PATTERN_SCORES = group_pattern_scores(
+    (mfg, MANUFACTURER_SCORES[mfg_type])
+    for mfg_type, mfg_list in MANUFACTURER_TYPES.items()
+    for mfg in mfg_list
+)
+
+# Multi-pattern matchers, built once at import when pyahocorasick is installed
+SSID_AUTOMATON = build_pattern_automaton(SSID_PATTERN_SCORES)
+MANUFACTURER_AUTOMATON = build_pattern_automaton(MANUFACTURER_PATTERN_SCORES)
+
+
+def match_automaton(automaton, text):
+    """Collect the score bumps of every distinct pattern found in a string
+
+    Args:
+        automaton (ahocorasick.Automaton): Automaton built by build_pattern_automaton
+        text (str): Uppercased string to search
+
+    Returns:
+        tuple: (score column, weight) pairs
+    """
+    # Each pattern counts once, however often it occurs
+    matches = {value for _, value in automaton.iter(text)}
+    return tuple(bump for _, bumps in matches for bump in bumps)
+
+
+def match_patterns(pattern_scores, text):
+    """Collect the score bumps of every pattern found in a string, one pattern at a time
+
+    Args:
+        pattern_scores (dict): Score bumps for each pattern
+        text (str): Uppercased string to search
+
+    Returns:
+        tuple: (score column, weight) pairs
+    """
+    return tuple(bump for pattern, bumps in pattern_scores.items() if pattern in text for bump in bumps)
+
+
+@lru_cache(maxsize=4096)
+def ssid_pattern_scores(ssid):
+    """Find the score bumps for the SSID patterns present in an SSID
+
+    Args:
+        ssid (str): Uppercased SSID
+
+    Returns:
+        tuple: (score column, weight) pairs
+    """
+    if SSID_AUTOMATON is not None:
+        return match_automaton(SSID_AUTOMATON, ssid)
+    return match_patterns(SSID_PATTERN_SCORES, ssid)
+
+
+@lru_cache(maxsize=4096)
+def manufacturer_pattern_scores(manufacturer):
+    """Find the score bumps for the manufacturer names present in a manufacturer string
+
+    Args:
+        manufacturer (str): Uppercased manufacturer
+
+    Returns:
+        tuple: (score column, weight) pairs
+    """
+    if MANUFACTURER_AUTOMATON is not None:
+        return match_automaton(MANUFACTURER_AUTOMATON, manufacturer)
+    return match_patterns(MANUFACTURER_PATTERN_SCORES, manufacturer)
+
+
+def intern_network_strings(network_data):
+    """Intern the repeated string fields of a loaded network in place
+
+    Args:
+        network_data (dict): Dictionary containing network information
+
+    Returns:
+        dict: The same network dictionary
+    """
+    for field in INTERNED_FIELDS:
+        value = network_data.get(field)
+        if type(value) is str:
+            network_data[field] = sys.intern(value)
+    
+    return network_data
+
+
+def network_row(network_data):
+    """Extract the normalized properties used for classification
+
+    Args:
+        network_data (dict): Dictionary containing network information
+
+    Returns:
+        tuple: (uppercased ssid, encryption, hidden, uppercased manufacturer, signal)
+    """
+    return (
+        network_data.get("ssid", "").upper(),
+        network_data.get("encryption", "Unknown"),
+        bool(network_data.get("hidden", False)),
+        network_data.get("manufacturer", "Unknown").upper(),
+        network_data.get("signal", -100)
+    )
+
 
 def classify_network(network_data):
     """Classify a network based on its characteristics
@@ -78,126 +291,208 @@ def classify_network(network_data):
     Returns:
         tuple: (classification, confidence score)
     """
-    scores = {
-        "POSSIBLE_OFFICIAL": 0,
-        "ENTERPRISE": 0,
-        "MOBILE_HOTSPOT": 0,
-        "PUBLIC": 0,
-        "IOT": 0,
-        "ISP_PROVIDED": 0,
-        "STANDARD": 0
-    }
+    return classify_row(*network_row(network_data))
+
+
+def classification_key(row):
+    """Reduce normalized network properties to the inputs the scoring rules depend on
+
+    Args:
+        row (tuple): Normalized network properties, as returned by network_row
+
+    Returns:
+        tuple: (ssid, encryption, hidden, manufacturer, signal band)
+    """
+    ssid, encryption, hidden, manufacturer, signal = row
     
-    # Extract network properties
-    ssid = network_data.get("ssid", "").upper()
-    encryption = network_data.get("encryption", "Unknown")
-    hidden = network_data.get("hidden", False)
-    manufacturer = network_data.get("manufacturer", "Unknown").upper()
-    signal = network_data.get("signal", -100)
+    # The rules only distinguish very strong, weak and other signals
+    band = 1 if signal > -40 else -1 if signal < -80 else 0
+    return ssid, encryption, hidden, manufacturer, band
+
+
+def classify_row(ssid, encryption, hidden, manufacturer, signal):
+    """Classify a network from its normalized properties
+
+    Args:
+        ssid (str): Uppercased SSID
+        encryption (str): Encryption type
+        hidden (bool): Whether the SSID is hidden
+        manufacturer (str): Uppercased manufacturer
+        signal (int): Signal strength in dBm
+
+    Returns:
+        tuple: (classification, confidence score)
+    """
+    # Scores in tie-break priority order
+    scores = [0] * len(TYPE_PRIORITY)
+    official, enterprise, hotspot, public, _, isp, standard = range(len(TYPE_PRIORITY))
     
     # Check for hidden network
     if hidden:
-        scores["POSSIBLE_OFFICIAL"] += 3
-        scores["ENTERPRISE"] += 2
+        scores[official] += 3
+        scores[enterprise] += 2
     
     # Check for strong encryption
     if encryption == "WPA2/WPA3":
-        scores["POSSIBLE_OFFICIAL"] += 2
-        scores["ENTERPRISE"] += 2
-        scores["ISP_PROVIDED"] += 1
+        scores[official] += 2
+        scores[enterprise] += 2
+        scores[isp] += 1
     elif encryption == "Open":
-        scores["PUBLIC"] += 3
+        scores[public] += 3
     
     # Check SSID patterns
-    for network_type, type_data in NETWORK_TYPES.items():
-        for pattern in type_data["ssid_patterns"]:
-            if pattern in ssid:
-                scores[network_type] += 4
+    for column, weight in ssid_pattern_scores(ssid):
+        scores[column] += weight
     
     # Check manufacturer
-    for mfg_type, mfg_list in MANUFACTURER_TYPES.items():
-        for mfg in mfg_list:
-            if mfg in manufacturer:
-                if mfg_type == "GOVERNMENT":
-                    scores["POSSIBLE_OFFICIAL"] += 4
-                elif mfg_type == "ENTERPRISE":
-                    scores["ENTERPRISE"] += 3
-                elif mfg_type == "CONSUMER":
-                    scores["STANDARD"] += 2
-                    scores["ISP_PROVIDED"] += 1
-                elif mfg_type == "MOBILE":
-                    scores["MOBILE_HOTSPOT"] += 4
-                elif mfg_type == "IOT":
-                    scores["IOT"] += 4
+    for column, weight in manufacturer_pattern_scores(manufacturer):
+        scores[column] += weight
     
     # Signal strength heuristics
     if signal > -40:  # Very strong signal
-        scores["STANDARD"] += 1
-        scores["ISP_PROVIDED"] += 1
+        scores[standard] += 1
+        scores[isp] += 1
     elif signal < -80:  # Weak signal
-        scores["MOBILE_HOTSPOT"] += 1
+        scores[hotspot] += 1
     
     # Find the highest scoring classification
-    max_score = max(scores.values())
+    max_score = max(scores)
     if max_score == 0:
         return "STANDARD", 0.0
     
-    # Find all types with max score (in case of tie)
-    candidates = [t for t, s in scores.items() if s == max_score]
-    if len(candidates) == 1:
-        # Clear winner
-        confidence = min(1.0, max_score / 10.0)  # Scale to 0.0-1.0
-        return candidates[0], confidence
-    else:
-        # In case of tie, choose based on priority
-        priorities = ["POSSIBLE_OFFICIAL", "ENTERPRISE", "MOBILE_HOTSPOT", 
-                       "PUBLIC", "IOT", "ISP_PROVIDED", "STANDARD"]
-        for p in priorities:
-            if p in candidates:
-                confidence = min(0.7, max_score / 10.0)  # Lower confidence due to tie
-                return p, confidence
+    # index() finds the first maximum, which is the highest priority type on a tie
+    best = scores.index(max_score)
     
-    # Fallback
-    return "STANDARD", 0.0
+    # Scale to 0.0-1.0, with lower confidence in case of tie
+    limit = 0.7 if scores.count(max_score) > 1 else 1.0
+    return TYPE_PRIORITY[best], min(limit, max_score / 10.0)
+
+
+def score_networks(rows):
+    """Classify many networks at once using a vectorized score matrix
+
+    Produces the same results as calling classify_row on each row.
+
+    Args:
+        rows (list): Normalized network properties, as returned by network_row
+
+    Returns:
+        tuple: (list of classifications, list of confidence scores)
+    """
+    count = len(rows)
+    official, enterprise, hotspot, public, _, isp, standard = range(len(TYPE_PRIORITY))
+    ssids, encryptions, hidden_flags, manufacturers, signal_values = zip(*rows) if rows else ((),) * 5
+    
+    # Gather the rule inputs as parallel arrays
+    signals = np.array(signal_values, dtype=np.float64)
+    hidden = np.array(hidden_flags, dtype=bool)
+    encryption = np.fromiter((ENCRYPTION_CODES.get(e, 0) for e in encryptions), dtype=np.int8, count=count)
+    
+    scores = np.zeros((count, len(TYPE_PRIORITY)), dtype=np.int16)
+    
+    # Check for hidden network
+    scores[hidden, official] += 3
+    scores[hidden, enterprise] += 2
+    
+    # Check for strong encryption
+    strong = encryption == ENCRYPTION_CODES["WPA2/WPA3"]
+    scores[strong, official] += 2
+    scores[strong, enterprise] += 2
+    scores[strong, isp] += 1
+    scores[encryption == ENCRYPTION_CODES["Open"], public] += 3
+    
+    # Signal strength heuristics
+    very_strong = signals > -40
+    scores[very_strong, standard] += 1
+    scores[very_strong, isp] += 1
+    scores[signals < -80, hotspot] += 1
+    
+    # Collect SSID and manufacturer pattern hits as (row, column, weight) triples
+    rows, columns, weights = [], [], []
+    for row, (ssid, manufacturer) in enumerate(zip(ssids, manufacturers)):
+        bumps = ssid_pattern_scores(ssid) + manufacturer_pattern_scores(manufacturer)
+        for column, weight in bumps:
+            rows.append(row)
+            columns.append(column)
+            weights.append(weight)
+    
+    np.add.at(scores, (np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)),
+              np.array(weights, dtype=np.int16))
+    
+    # argmax returns the first maximum, which is the highest priority type on a tie
+    best = scores.argmax(axis=1)
+    max_scores = scores[np.arange(count), best]
+    tied = (scores == max_scores[:, None]).sum(axis=1) > 1
+    confidences = np.minimum(np.where(tied, 0.7, 1.0), max_scores / 10.0)
+    
+    # Networks without any score are STANDARD with no confidence
+    unscored = max_scores == 0
+    best[unscored] = standard
+    confidences[unscored] = 0.0
+    
+    return [TYPE_PRIORITY[index] for index in best.tolist()], confidences.tolist()
 
 
-def enhanced_network_classification(networks):
+def enhanced_network_classification(networks, cache=None):
     """Perform enhanced classification on a set of networks
 
     Args:
         networks (dict): Dictionary of networks to classify
+        cache (dict, optional): Classification cache keyed by classification_key, updated with
+            new results. Defaults to None (classify every network).
 
     Returns:
-        dict: Updated networks with enhanced classification
+        tuple: (updated networks, type distribution in priority order, networks sorted by type
+            priority then confidence)
     """
-    logger.info(f"Performing enhanced classification on {len(networks)} networks")
+    # Normalize every network's properties in one pass
+    rows = [network_row(network) for network in networks.values()]
     
-    for bssid, network in networks.items():
-        classification, confidence = classify_network(network)
+    if cache is None:
+        classifications, confidences = score_networks(rows)
+    else:
+        # Score only the property combinations not classified before
+        keys = [classification_key(row) for row in rows]
+        misses = {}
+        for key, row in zip(keys, rows):
+            if key not in cache:
+                misses.setdefault(key, row)
+        
+        if misses:
+            for key, result in zip(misses, zip(*score_networks(list(misses.values())))):
+                cache[key] = result
+        
+        classifications, confidences = zip(*[cache[key] for key in keys]) if keys else ((), ())
+        logger.debug("Classification cache: %d hits, %d new", len(keys) - len(misses), len(misses))
+    
+    # Tally the types while the classifications are at hand
+    counts = Counter(classifications)
+    distribution = {network_type: counts[network_type] for network_type in TYPE_PRIORITY}
+    
+    decorated = []
+    for (bssid, network), classification, confidence in zip(networks.items(), classifications, confidences):
+        rounded = round(confidence, 2)
         network["type"] = classification
-        network["classification_confidence"] = f"{confidence:.2f}"
+        network["classification_confidence"] = rounded
+        
+        # Sort key for display: type priority, then confidence
+        decorated.append(((TYPE_INDEX[classification], -rounded), network))
         
         # Add additional classification information
-        if classification == "POSSIBLE_OFFICIAL":
-            network["classification_note"] = "This network has characteristics consistent with official/government networks. This is a heuristic classification only and should be verified."
-            logger.info(f"Classified {network['ssid']} ({bssid}) as POSSIBLE_OFFICIAL with {confidence:.2f} confidence")
+        note = CLASSIFICATION_NOTES.get(classification)
+        if note:
+            network["classification_note"] = note
         
-        elif classification == "ENTERPRISE":
-            network["classification_note"] = "This network appears to be an enterprise/corporate network based on its characteristics."
-            
-        elif classification == "MOBILE_HOTSPOT":
-            network["classification_note"] = "This network appears to be a mobile hotspot or temporary network."
-            
-        elif classification == "PUBLIC":
-            network["classification_note"] = "This network appears to be a public access point."
-            
-        elif classification == "IOT":
-            network["classification_note"] = "This network appears to be associated with IoT devices."
-            
-        elif classification == "ISP_PROVIDED":
-            network["classification_note"] = "This network appears to be an ISP-provided default configuration."
+        if classification == "POSSIBLE_OFFICIAL":
+            logger.debug("Classified %s (%s) as POSSIBLE_OFFICIAL with %.2f confidence",
+                         network["ssid"], bssid, confidence)
+    
+    logger.info("Classified %d networks (%d POSSIBLE_OFFICIAL)", len(networks), distribution["POSSIBLE_OFFICIAL"])
     
-    return networks
+    decorated.sort(key=itemgetter(0))
+    sorted_networks = [network for _, network in decorated]
+    
+    return networks, distribution, sorted_networks
 
 
 def analyze_network_distribution(networks):
@@ -209,22 +504,13 @@ def analyze_network_distribution(networks):
     Returns:
         dict: Dictionary with network type distribution
     """
-    distribution = {
-        "POSSIBLE_OFFICIAL": 0,
-        "ENTERPRISE": 0,
-        "MOBILE_HOTSPOT": 0,
-        "PUBLIC": 0,
-        "IOT": 0,
-        "ISP_PROVIDED": 0,
-        "STANDARD": 0
-    }
+    counts = Counter(network.get("type", "STANDARD") for network in networks.values())
     
-    for network in networks.values():
-        network_type = network.get("type", "STANDARD")
-        if network_type in distribution:
-            distribution[network_type] += 1
-        else:
-            distribution["STANDARD"] += 1
+    # Report every known type, in priority order
+    distribution = {network_type: counts.pop(network_type, 0) for network_type in TYPE_PRIORITY}
+    
+    # Unrecognized types are counted as STANDARD
+    distribution["STANDARD"] += sum(counts.values())
     
     return distribution
 
@@ -238,27 +524,15 @@ def print_classified_network(network):
     ssid = network["ssid"]
     bssid = network["bssid"]
     network_type = network["type"]
-    confidence = float(network.get("classification_confidence", 0))
+    confidence = network.get("classification_confidence", 0.0)
     
     # Format confidence as stars
     confidence_stars = int(confidence * 5)
     stars = "★" * confidence_stars + "☆" * (5 - confidence_stars)
     
     # Color coding based on network type
-    if network_type == "POSSIBLE_OFFICIAL":
-        type_str = "\033[91m{}\033[0m".format(network_type)  # Red
-    elif network_type == "ENTERPRISE":
-        type_str = "\033[94m{}\033[0m".format(network_type)  # Blue
-    elif network_type == "MOBILE_HOTSPOT":
-        type_str = "\033[92m{}\033[0m".format(network_type)  # Green
-    elif network_type == "PUBLIC":
-        type_str = "\033[93m{}\033[0m".format(network_type)  # Yellow
-    elif network_type == "IOT":
-        type_str = "\033[95m{}\033[0m".format(network_type)  # Purple
-    elif network_type == "ISP_PROVIDED":
-        type_str = "\033[96m{}\033[0m".format(network_type)  # Cyan
-    else:
-        type_str = network_type
+    color = TYPE_COLORS.get(network_type)
+    type_str = f"{color}{network_type}\033[0m" if color else network_type
     
     print(f"{ssid} ({bssid}) | Type: {type_str} | Confidence: {stars} ({confidence:.2f})")
     
@@ -266,12 +540,13 @@ def print_classified_network(network):
         print(f"  Note: {network['classification_note']}")
 
 
-def save_classification_results(networks, filename):
+def save_classification_results(networks, filename, distribution=None):
     """Save classification results to a JSON file
 
     Args:
         networks (dict): Dictionary of classified networks
         filename (str): Output filename
+        distribution (dict, optional): Precomputed type distribution. Defaults to None (computed here).
 
     Returns:
         str: Path to the saved file
@@ -281,25 +556,58 @@ def save_classification_results(networks, filename):
     
     output_path = os.path.join(output_dir, filename)
     
-    # Convert network dict to a list for JSON serialization
-    network_list = list(networks.values())
-    
     # Add metadata
-    classification_data = {
+    metadata = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "total_networks": len(networks),
-        "distribution": analyze_network_distribution(networks),
-        "networks": network_list
+        "distribution": distribution if distribution is not None else analyze_network_distribution(networks)
     }
     
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(classification_data, f, indent=4)
+    # Write to file, streaming the networks one at a time
+    dump_json_records(output_path, metadata, "networks", networks.values())
     
     print(f"\nClassification results saved to {output_path}")
     return output_path
 
 
+def load_classification_cache(cache_file):
+    """Load a classification cache saved by save_classification_cache
+
+    Args:
+        cache_file (str): Path to the cache file
+
+    Returns:
+        dict: Cached (classification, confidence) results by classification_key
+    """
+    if not os.path.exists(cache_file):
+        return {}
+    
+    try:
+        entries = load_json(cache_file)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable classification cache {cache_file}: {str(e)}")
+        return {}
+    
+    return {
+        (ssid, encryption, hidden, manufacturer, band): (classification, confidence)
+        for ssid, encryption, hidden, manufacturer, band, classification, confidence in entries
+    }
+
+
+def save_classification_cache(cache, cache_file):
+    """Save a classification cache as a list of flat entries
+
+    Args:
+        cache (dict): Cached (classification, confidence) results by classification_key
+        cache_file (str): Path to the cache file
+    """
+    cache_dir = os.path.dirname(cache_file)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    dump_json([key + result for key, result in cache.items()], cache_file)
+
+
 def main():
     """Main function for the classifier module"""
     parser = argparse.ArgumentParser(description="WifiObserver - Network Classifier")
@@ -308,6 +616,9 @@ def main():
     parser.add_argument("--output", "-o", default=f"classification_{int(time.time())}.json", help="Output file name")
     parser.add_argument("--scan-time", "-t", type=int, default=60, help="Scan duration in seconds (if not using input file)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--scapy", action="store_true", help="Capture through scapy instead of the raw socket reader")
+    parser.add_argument("--classification-cache", default=None,
+                        help="Reuse classifications of previously seen networks (e.g. data/classify_cache.json)")
     args = parser.parse_args()
     
     log_header("WifiObserver Network Classifier")
@@ -321,13 +632,12 @@ def main():
         print(f"Loading network data from {args.input}")
         
         try:
-            with open(args.input, "r") as f:
-                data = json.load(f)
-                
+            data = load_json(args.input)
+            
             if "networks" in data:
                 # Handle the format from wifi_scanner output
                 for network in data["networks"]:
-                    bssid = network["bssid"]
+                    bssid = intern_network_strings(network)["bssid"]
                     networks[bssid] = network
                     if network.get("hidden", False):
                         hidden_networks.add(bssid)
@@ -335,7 +645,8 @@ def main():
                 # Try to handle other possible formats
                 for bssid, network in data.items():
                     if isinstance(network, dict) and "bssid" in network:
-                        networks[bssid] = network
+                        bssid = sys.intern(bssid)
+                        networks[bssid] = intern_network_strings(network)
                         if network.get("hidden", False):
                             hidden_networks.add(bssid)
                 
@@ -365,17 +676,29 @@ def main():
         
         try:
             # Perform the scan
-            import scapy.all as scapy
             print(f"Scanning for {args.scan_time} seconds...")
-            scapy.sniff(
-                iface=interface,
-                prn=process_packet,
-                store=False,
-                timeout=args.scan_time
-            )
+            if raw_capture.AVAILABLE and not args.scapy:
+                # Parse frames straight off a raw socket, skipping scapy's dissectors
+                raw_capture.capture_frames(interface, process_packet_raw, timeout=args.scan_time)
+            else:
+                import scapy.all as scapy
+                scapy.sniff(
+                    iface=interface,
+                    prn=process_packet,
+                    store=False,
+                    timeout=args.scan_time
+                )
             
+            scanner.flush_output()
             print(f"Scan completed. Discovered {len(networks)} networks ({len(hidden_networks)} hidden)")
             
+        except KeyboardInterrupt:
+            scanner.flush_output()
+            print("\n\nScan interrupted. Shutting down gracefully...")
+            print(f"Discovered {len(networks)} networks ({len(hidden_networks)} hidden)")
+            print("Exiting...")
+            sys.exit(0)
+        
         except Exception as e:
             logger.error(f"Error during scan: {str(e)}")
             print(f"Error during scan: {str(e)}")
@@ -383,23 +706,20 @@ def main():
     
     # Perform enhanced classification
     print("\nClassifying networks...")
-    classified_networks = enhanced_network_classification(networks)
+    cache = load_classification_cache(args.classification_cache) if args.classification_cache else None
+    classified_networks, distribution, sorted_networks = enhanced_network_classification(networks, cache)
+    if cache is not None:
+        save_classification_cache(cache, args.classification_cache)
     
     # Print classification results
     print("\nClassification Results:")
     print("-" * 60)
     
-    # Sort networks by type for organized display
-    sorted_networks = sorted(
-        classified_networks.values(),
-        key=lambda n: (n.get("type", "STANDARD"), -float(n.get("classification_confidence", 0)))
-    )
-    
+    # Networks come back sorted by type priority, then confidence, for organized display
     for network in sorted_networks:
         print_classified_network(network)
     
     # Print distribution summary
-    distribution = analyze_network_distribution(classified_networks)
     print("\nNetwork Type Distribution:")
     for network_type, count in distribution.items():
         if count > 0:
@@ -407,7 +727,7 @@ def main():
             print(f"  {network_type}: {count} ({percent:.1f}%)")
     
     # Save classification results
-    save_classification_results(classified_networks, args.output)
+    save_classification_results(classified_networks, args.output, distribution)
     
     print("\nClassification complete!")
 
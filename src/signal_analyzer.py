@@ -9,34 +9,70 @@ over time, helping to identify signal patterns and stability.
 """
 
 import argparse
-import json
+import collections
 import os
 import sys
+import threading
 import time
 import signal
 from datetime import datetime
+from functools import lru_cache
+
+# Add parent directory to path to enable imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Point matplotlib at the shared config directory before importing it
+from graphs._mpl import use_file_backend
+
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.ticker import FuncFormatter
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Parallel loop over networks when numba compiles it, a plain range otherwise
+prange = numba.prange if numba is not None else range
+
 try:
     import scapy.all as scapy
 except ImportError:
     print("Error: Scapy library not found. Please install it using 'pip install scapy'")
     sys.exit(1)
 
-# Add parent directory to path to enable imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utils.interface_manager import set_monitor_mode, check_interface
 from src.utils.logging_utils import setup_logger, log_header
+from src.utils import raw_capture
+from src.utils.json_utils import dump_json, load_json
 
 # Initialize logger
 logger = setup_logger("signal_analyzer")
 
+# Default signal samples kept per network; older samples are overwritten once the buffer is full
+SIGNAL_HISTORY_SIZE = 4096
+
+# Range of the int8 signal buffers
+SIGNAL_MIN = -128
+SIGNAL_MAX = 127
+
+# Most signal samples written to the report per network
+REPORT_MAX_POINTS = 500
+
+# Captured frames waiting to be processed; the oldest are dropped if processing falls this far behind
+FRAME_QUEUE_SIZE = 100000
+
+# Seconds between batches of queued frames
+PROCESS_INTERVAL = 0.1
+
 # Global variables
 networks = {}
-signal_history = {}
 interrupted = False
+history_size = SIGNAL_HISTORY_SIZE
+capture_start_ts = time.time()
 
 
 def signal_handler(sig, frame):
@@ -55,6 +91,8 @@ def initialize_analysis(interface):
     Returns:
         str: Interface name
     """
+    global capture_start_ts
+    
     # Ensure interface exists
     if not check_interface(interface):
         logger.error(f"Interface {interface} not found. Please check available interfaces.")
@@ -66,6 +104,9 @@ def initialize_analysis(interface):
     # Setup signal handler for graceful exit
     signal.signal(signal.SIGINT, signal_handler)
     
+    # The report duration is measured from here
+    capture_start_ts = time.time()
+    
     log_header(f"Starting Wi-Fi signal analysis on interface {interface}")
     logger.info(f"Analysis initiated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("Press Ctrl+C to stop analysis and view results")
@@ -79,12 +120,49 @@ def process_beacon(packet):
     Args:
         packet: Scapy packet
     """
-    # Extract the network MAC
-    bssid = packet[scapy.Dot11].addr2
+    # Extract the network MAC as raw bytes, matching the raw capture path
+    bssid = bytes.fromhex(packet[scapy.Dot11].addr2.replace(":", ""))
     
     # Extract the network name (SSID)
     try:
-        ssid = packet[scapy.Dot11Elt].info.decode("utf-8")
+        ssid = packet[scapy.Dot11Elt].info
+    except:
+        ssid = None
+    
+    # Get signal strength
+    signal = get_signal_strength(packet)
+    
+    # Use the time the packet was captured
+    record_signal(bssid, ssid, signal, float(packet.time))
+
+
+def process_frame(frame, timestamp):
+    """Process a raw radiotap frame for signal analysis without building a scapy packet
+
+    Args:
+        frame (bytes): Captured frame
+        timestamp (float): Kernel receive time of the frame as a Unix timestamp
+    """
+    beacon = raw_capture.parse_beacon(frame)
+    if beacon is None:
+        return
+    
+    # Get signal strength, with the same default as get_signal_strength
+    bssid, signal, ssid = beacon
+    record_signal(bssid, ssid, signal if signal is not None else -100, timestamp)
+
+
+def decode_ssid(raw_ssid):
+    """Decode the SSID of a newly seen network
+
+    Args:
+        raw_ssid (bytes): SSID element body, or None if missing
+
+    Returns:
+        str: Network name
+    """
+    try:
+        ssid = raw_ssid.decode("utf-8")
     except:
         ssid = "Unknown"
     
@@ -92,29 +170,63 @@ def process_beacon(packet):
     if ssid == "" or not ssid:
         ssid = "[Hidden Network]"
     
-    # Get signal strength
-    signal = get_signal_strength(packet)
-    
-    # Get current timestamp
-    timestamp = time.time()
-    
-    # Add/update network in the dictionary
-    if bssid not in networks:
-        networks[bssid] = {
-            "ssid": ssid,
-            "bssid": bssid,
+    return ssid
+
+
+def record_signal(bssid, raw_ssid, signal, timestamp):
+    """Record a signal strength sample for a network
+
+    Args:
+        bssid (bytes): Network MAC address as 6 raw bytes
+        raw_ssid (bytes): SSID element body, or None if missing; only decoded for new networks
+        signal (int): Signal strength in dBm
+        timestamp (float): Capture time of the sample as a Unix timestamp
+    """
+    # Look the network up once, adding it on first sight
+    network = networks.get(bssid)
+    if network is None:
+        network = networks[bssid] = {
+            "ssid": decode_ssid(raw_ssid),
+            "bssid": bssid.hex(":"),
             "first_seen": timestamp,
-            "signals": []
+            # Preallocated ring buffer of signal samples
+            "timestamps": np.empty(history_size, dtype=np.float64),
+            "signals": np.empty(history_size, dtype=np.int8),
+            "head": 0,
+            "count": 0
         }
-        # Initialize signal history
-        signal_history[bssid] = []
     
     # Update signal information
-    networks[bssid]["last_seen"] = timestamp
-    networks[bssid]["signals"].append((timestamp, signal))
+    network["last_seen"] = timestamp
+    
+    # Record the sample in the ring buffer, clipped to the int8 range
+    signals = network["signals"]
+    head = network["head"]
+    network["timestamps"][head] = timestamp
+    signals[head] = max(SIGNAL_MIN, min(SIGNAL_MAX, int(signal)))
+    network["head"] = (head + 1) % len(signals)
+    network["count"] = min(network["count"] + 1, len(signals))
+
+
+def get_signal_samples(network):
+    """Get a network's recorded signal samples in chronological order
+
+    Args:
+        network (dict): Network information with its signal ring buffer
+
+    Returns:
+        tuple: (timestamps, signal strengths) as NumPy arrays
+    """
+    timestamps = network["timestamps"]
+    signals = network["signals"]
+    count = network["count"]
+    
+    # Until the buffer wraps, the samples are a contiguous prefix
+    if count < len(signals):
+        return timestamps[:count], signals[:count]
     
-    # Keep a record of signal strength for this network
-    signal_history[bssid].append((timestamp, signal))
+    head = network["head"]
+    return np.concatenate((timestamps[head:], timestamps[:head])), np.concatenate((signals[head:], signals[:head]))
 
 
 def process_packet(packet):
@@ -138,35 +250,147 @@ def get_signal_strength(packet):
         int: Signal strength in dBm
     """
     # This is a vendor-specific extension for Linux, might not work on all setups
-    if hasattr(packet, "dBm_AntSignal"):
+    if getattr(packet, "dBm_AntSignal", None) is not None:
         return packet.dBm_AntSignal
     return -100  # Default value if not available
 
 
-def analyze_signal_stability(signals, network_info):
+def stability_sums(signals):
+    """Compute the exact integer sums behind the signal stability statistics
+
+    Args:
+        signals (numpy.ndarray): Signal strengths in chronological order
+
+    Returns:
+        tuple: (total, sum of squares, minimum, maximum, total of the first half)
+    """
+    # Widen once so sums and squares cannot overflow the int8 samples
+    signal_values = signals.astype(np.int64)
+    
+    return (
+        int(signal_values.sum()),
+        int(np.dot(signal_values, signal_values)),
+        int(signal_values.min()),
+        int(signal_values.max()),
+        int(signal_values[:len(signal_values) // 2].sum())
+    )
+
+
+def stability_sums_loop(signals):
+    """Compute the same sums as stability_sums in a single loop, for compilation with numba
+
+    Args:
+        signals (numpy.ndarray): Signal strengths in chronological order
+
+    Returns:
+        tuple: (total, sum of squares, minimum, maximum, total of the first half)
+    """
+    middle = len(signals) // 2
+    total = 0
+    squares = 0
+    first_total = 0
+    min_signal = int(signals[0])
+    max_signal = min_signal
+    
+    for index in range(len(signals)):
+        value = int(signals[index])
+        total += value
+        squares += value * value
+        min_signal = min(min_signal, value)
+        max_signal = max(max_signal, value)
+        if index < middle:
+            first_total += value
+    
+    return total, squares, min_signal, max_signal, first_total
+
+
+# Compile the single-pass loop when numba is installed
+if numba is not None:
+    stability_sums = numba.njit(cache=True, boundscheck=False)(stability_sums_loop)
+
+
+def stability_sums_batch(samples, counts):
+    """Compute stability_sums for every network at once
+
+    Args:
+        samples (numpy.ndarray): One row of chronological signal strengths per network, padded to equal length
+        counts (numpy.ndarray): Number of valid samples in each row
+
+    Returns:
+        numpy.ndarray: One row of (total, sum of squares, minimum, maximum, total of the first half) per network
+    """
+    # Widen once and mask out the padding and the second half of each row
+    values = samples.astype(np.int64)
+    columns = np.arange(samples.shape[1])
+    valid = columns < counts[:, None]
+    first_half = columns < (counts // 2)[:, None]
+    
+    return np.stack((
+        values.sum(axis=1, where=valid),
+        (values * values).sum(axis=1, where=valid),
+        values.min(axis=1, where=valid, initial=SIGNAL_MAX),
+        values.max(axis=1, where=valid, initial=SIGNAL_MIN),
+        values.sum(axis=1, where=first_half)
+    ), axis=1)
+
+
+def stability_sums_batch_loop(samples, counts):
+    """Compute the same rows as stability_sums_batch one network per iteration, for compilation with numba
+
+    Args:
+        samples (numpy.ndarray): One row of chronological signal strengths per network, padded to equal length
+        counts (numpy.ndarray): Number of valid samples in each row
+
+    Returns:
+        numpy.ndarray: One row of (total, sum of squares, minimum, maximum, total of the first half) per network
+    """
+    sums = np.empty((len(counts), 5), dtype=np.int64)
+    
+    # Rows are independent, so numba spreads them across cores
+    for row in prange(len(counts)):
+        total, squares, min_signal, max_signal, first_total = stability_sums(samples[row, :counts[row]])
+        sums[row, 0] = total
+        sums[row, 1] = squares
+        sums[row, 2] = min_signal
+        sums[row, 3] = max_signal
+        sums[row, 4] = first_total
+    
+    return sums
+
+
+# Compile the parallel batch when numba is installed
+if numba is not None:
+    stability_sums_batch = numba.njit(parallel=True, cache=True, boundscheck=False)(stability_sums_batch_loop)
+
+
+def analyze_signal_stability(signals, sums=None):
     """Analyze the stability of a network's signal
 
     Args:
-        signals (list): List of (timestamp, signal_strength) tuples
-        network_info (dict): Network information
+        signals (numpy.ndarray): Signal strengths in chronological order
+        sums (tuple, optional): Precomputed stability_sums of the signals. Defaults to None (computed here).
 
     Returns:
         dict: Signal stability metrics
     """
-    if not signals or len(signals) < 3:
+    count = len(signals)
+    if count < 3:
         return {"stability": "Unknown", "std_dev": 0, "range": 0, "trend": "Unknown"}
     
-    # Extract signal values (ignore timestamps for statistical analysis)
-    signal_values = [s[1] for s in signals]
-    
-    # Calculate basic statistics
-    mean = np.mean(signal_values)
-    median = np.median(signal_values)
-    std_dev = np.std(signal_values)
-    min_signal = min(signal_values)
-    max_signal = max(signal_values)
+    # Calculate basic statistics from exact integer sums
+    total, squares, min_signal, max_signal, first_total = sums if sums is not None else stability_sums(signals)
+    mean = np.float64(total) / count
+    std_dev = np.sqrt(np.float64(count * squares - total * total)) / count
     signal_range = max_signal - min_signal
     
+    # Select the middle value(s) without sorting the whole array
+    middle = count // 2
+    if count % 2:
+        median = np.float64(np.partition(signals, middle)[middle])
+    else:
+        partitioned = np.partition(signals, (middle - 1, middle)).astype(np.int64)
+        median = (partitioned[middle - 1] + partitioned[middle]) / 2
+    
     # Determine stability category
     if std_dev < 2:
         stability = "Very Stable"
@@ -178,12 +402,10 @@ def analyze_signal_stability(signals, network_info):
         stability = "Unstable"
     
     # Determine signal trend
-    if len(signal_values) >= 10:
+    if count >= 10:
         # Use the first and second half of the data to determine trend
-        first_half = signal_values[:len(signal_values)//2]
-        second_half = signal_values[len(signal_values)//2:]
-        first_mean = np.mean(first_half)
-        second_mean = np.mean(second_half)
+        first_mean = np.float64(first_total) / middle
+        second_mean = np.float64(total - first_total) / (count - middle)
         
         if second_mean - first_mean > 3:
             trend = "Improving"
@@ -206,6 +428,63 @@ def analyze_signal_stability(signals, network_info):
     }
 
 
+def downsample_signals(timestamps, signals, max_points=REPORT_MAX_POINTS):
+    """Reduce a signal series to at most max_points samples, keeping each bucket's extremes
+
+    The series is split into max_points // 2 equal buckets and the minimum and maximum
+    sample of each bucket are kept in chronological order, so peaks and dips survive.
+
+    Args:
+        timestamps (numpy.ndarray): Sample timestamps in chronological order
+        signals (numpy.ndarray): Signal strengths matching the timestamps
+        max_points (int, optional): Most samples to keep. Defaults to REPORT_MAX_POINTS.
+
+    Returns:
+        tuple: (timestamps, signal strengths) of the kept samples
+    """
+    count = len(signals)
+    if count <= max_points:
+        return timestamps, signals
+    
+    # Indices of the lowest and highest sample in each bucket
+    bounds = np.linspace(0, count, max_points // 2 + 1).astype(np.intp)
+    keep = []
+    for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        bucket = signals[start:stop]
+        keep.append(start + int(bucket.argmin()))
+        keep.append(start + int(bucket.argmax()))
+    
+    # Chronological order, without repeating a sample that is both minimum and maximum
+    indices = np.unique(np.array(keep, dtype=np.intp))
+    return timestamps[indices], signals[indices]
+
+
+@lru_cache(maxsize=4096)
+def format_clock_time(seconds):
+    """Format a whole-second Unix timestamp as local HH:MM:SS
+
+    Args:
+        seconds (int): Unix timestamp truncated to whole seconds
+
+    Returns:
+        str: Local time of day
+    """
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
+
+
+@lru_cache(maxsize=4096)
+def format_date_time(seconds):
+    """Format a whole-second Unix timestamp as local YYYY-MM-DD HH:MM:SS
+
+    Args:
+        seconds (int): Unix timestamp truncated to whole seconds
+
+    Returns:
+        str: Local date and time
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
 def generate_signal_report(output_file=None):
     """Generate a report of signal analysis
 
@@ -226,22 +505,35 @@ def generate_signal_report(output_file=None):
     
     output_path = os.path.join(output_dir, output_file)
     
+    # Gather each recorded network's samples into one padded matrix
+    recorded = [(network,) + get_signal_samples(network) for network in networks.values() if network["count"] > 0]
+    counts = np.array([len(signals) for _, _, signals in recorded], dtype=np.int64)
+    samples = np.zeros((len(recorded), counts.max(initial=0)), dtype=np.int8)
+    for row, (_, _, signals) in enumerate(recorded):
+        samples[row, :len(signals)] = signals
+    
+    # Reduce every network's samples in a single batch
+    sums = stability_sums_batch(samples, counts).tolist()
+    
     # Process signal data for each network
     results = []
-    for bssid, network in networks.items():
-        if bssid in signal_history and len(signal_history[bssid]) > 0:
-            signals = signal_history[bssid]
-            stability_metrics = analyze_signal_stability(signals, network)
-            
-            # Add to results
-            results.append({
-                "ssid": network["ssid"],
-                "bssid": bssid,
-                "first_seen": datetime.fromtimestamp(network["first_seen"]).strftime("%Y-%m-%d %H:%M:%S"),
-                "last_seen": datetime.fromtimestamp(network["last_seen"]).strftime("%Y-%m-%d %H:%M:%S"),
-                "signal_metrics": stability_metrics,
-                "raw_signal_data": [(datetime.fromtimestamp(ts).strftime("%H:%M:%S"), sig) for ts, sig in signals]
-            })
+    for (network, timestamps, signals), network_sums in zip(recorded, sums):
+        stability_metrics = analyze_signal_stability(signals, network_sums)
+        
+        # Only the report's sample series is reduced; the metrics above use every sample
+        timestamps, signals = downsample_signals(timestamps, signals)
+        
+        # Add to results, with sample times as seconds since the network was first seen
+        results.append({
+            "ssid": network["ssid"],
+            "bssid": network["bssid"],
+            "first_seen": format_date_time(int(network["first_seen"])),
+            "first_seen_timestamp": network["first_seen"],
+            "last_seen": format_date_time(int(network["last_seen"])),
+            "signal_metrics": stability_metrics,
+            "ts": np.round(timestamps - network["first_seen"], 3),
+            "sig": signals
+        })
     
     # Sort by signal strength (strongest first)
     results.sort(key=lambda x: x["signal_metrics"].get("mean", -100), reverse=True)
@@ -249,14 +541,13 @@ def generate_signal_report(output_file=None):
     # Create report
     report = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "duration": f"{(time.time() - min(n['first_seen'] for n in networks.values()))/60:.1f} minutes",
+        "duration": f"{(time.time() - capture_start_ts)/60:.1f} minutes",
         "total_networks": len(networks),
         "networks": results
     }
     
-    # Save to file
-    with open(output_path, "w") as f:
-        json.dump(report, f, indent=4)
+    # Save to file, serializing the sample arrays directly
+    dump_json(report, output_path)
     
     print(f"\nSignal analysis report saved to {output_path}")
     return output_path
@@ -278,52 +569,51 @@ def plot_signal_trends(network_data, output_dir="graphs"):
     # Limit to top 5 strongest networks
     top_networks = sorted_networks[:5]
     
+    # One figure is redrawn for every chart instead of creating a new one each time
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
     # Plot individual signal trends
     for network in top_networks:
         ssid = network["ssid"]
         bssid = network["bssid"]
-        raw_data = network["raw_signal_data"]
+        offsets = network["ts"]
+        signal_values = network["sig"]
         
-        if len(raw_data) < 3:
+        if len(signal_values) < 3:
             continue
         
-        # Extract data
-        timestamps = [d[0] for d in raw_data]
-        signal_values = [d[1] for d in raw_data]
-        
-        # Create plot
-        plt.figure(figsize=(10, 6))
-        plt.plot(timestamps, signal_values, marker='o', linestyle='-', markersize=4)
+        # Create plot on a numeric time axis
+        ax.cla()
+        ax.plot(offsets, signal_values, marker='o', linestyle='-', markersize=4)
         
         # Set labels and title
-        plt.title(f"Signal Strength Trend: {ssid} ({bssid})", fontsize=14, fontweight='bold')
-        plt.xlabel("Time", fontsize=12)
-        plt.ylabel("Signal Strength (dBm)", fontsize=12)
+        ax.set_title(f"Signal Strength Trend: {ssid} ({bssid})", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Time", fontsize=12)
+        ax.set_ylabel("Signal Strength (dBm)", fontsize=12)
         
         # Set y-axis limits and grid
-        plt.ylim(min(signal_values) - 5, max(signal_values) + 5)
-        plt.grid(True, alpha=0.3)
+        ax.set_ylim(min(signal_values) - 5, max(signal_values) + 5)
+        ax.grid(True, alpha=0.3)
         
-        # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45, ha='right')
+        # Label the automatically placed ticks with the local time of day
+        start = network["first_seen_timestamp"]
+        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, pos, start=start: format_clock_time(int(start + x))))
         
-        # Show only some of the x-axis labels to avoid crowding
-        if len(timestamps) > 10:
-            step = len(timestamps) // 10
-            plt.xticks(range(0, len(timestamps), step), [timestamps[i] for i in range(0, len(timestamps), step)])
+        # Rotate x-axis labels for better readability
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Add average line
         avg = network["signal_metrics"]["mean"]
-        plt.axhline(y=avg, color='r', linestyle='--', alpha=0.7, label=f"Average: {avg} dBm")
+        ax.axhline(y=avg, color='r', linestyle='--', alpha=0.7, label=f"Average: {avg} dBm")
         
         # Add signal quality zones
-        plt.axhspan(-50, 0, alpha=0.2, color='green', label='Excellent')
-        plt.axhspan(-70, -50, alpha=0.2, color='yellow', label='Good')
-        plt.axhspan(-90, -70, alpha=0.2, color='orange', label='Fair')
-        plt.axhspan(-100, -90, alpha=0.2, color='red', label='Poor')
+        ax.axhspan(-50, 0, alpha=0.2, color='green', label='Excellent')
+        ax.axhspan(-70, -50, alpha=0.2, color='yellow', label='Good')
+        ax.axhspan(-90, -70, alpha=0.2, color='orange', label='Fair')
+        ax.axhspan(-100, -90, alpha=0.2, color='red', label='Poor')
         
         # Add legend
-        plt.legend(loc='lower right')
+        ax.legend(loc='lower right')
         
         # Add stability information
         stability_info = f"Stability: {network['signal_metrics']['stability']}\n"
@@ -331,66 +621,115 @@ def plot_signal_trends(network_data, output_dir="graphs"):
         stability_info += f"Range: {network['signal_metrics']['range']} dBm\n"
         stability_info += f"Trend: {network['signal_metrics']['trend']}"
         
-        plt.figtext(0.15, 0.15, stability_info, fontsize=10,
-                   bbox=dict(boxstyle="round,pad=0.5", facecolor="white", alpha=0.8))
+        info_text = fig.text(0.15, 0.15, stability_info, fontsize=10,
+                             bbox=dict(boxstyle="round,pad=0.5", facecolor="white", alpha=0.8))
         
-        # Adjust layout and save
-        plt.tight_layout()
+        # Adjust layout and save at screen resolution
+        fig.tight_layout()
         filename = f"{output_dir}/signal_trend_{bssid.replace(':', '')}.png"
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filename, dpi=120)
+        info_text.remove()
         
         print(f"Signal trend chart for {ssid} saved to {filename}")
     
-    # Create comparative chart for all top networks
-    plt.figure(figsize=(12, 8))
+    # Reuse the figure for the comparative chart for all top networks
+    ax.cla()
+    fig.set_size_inches(12, 8)
+    
+    # Place every network's samples on a shared time axis starting at the earliest first sighting
+    start = min((network["first_seen_timestamp"] for network in top_networks), default=0)
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    segments = []
+    legend_lines = []
     
     for network in top_networks:
-        ssid = network["ssid"]
-        raw_data = network["raw_signal_data"]
+        signal_values = network["sig"]
         
-        if len(raw_data) < 3:
+        if len(signal_values) < 3:
             continue
         
-        # Extract data
-        timestamps = [d[0] for d in raw_data]
-        signal_values = [d[1] for d in raw_data]
-        
-        # Plot this network's signal trend
-        plt.plot(range(len(timestamps)), signal_values, marker='.', label=ssid)
+        # Collect this network's signal trend
+        offsets = np.asarray(network["ts"]) + (network["first_seen_timestamp"] - start)
+        segments.append(np.column_stack((offsets, signal_values)))
+        legend_lines.append(Line2D([], [], color=colors[len(legend_lines) % len(colors)], label=network["ssid"]))
+    
+    # Draw all trends as one collection
+    ax.add_collection(LineCollection(segments, colors=[line.get_color() for line in legend_lines], linewidths=1))
+    ax.autoscale_view()
     
     # Set labels and title
-    plt.title("Comparative Signal Trends for Top Networks", fontsize=14, fontweight='bold')
-    plt.xlabel("Time", fontsize=12)
-    plt.ylabel("Signal Strength (dBm)", fontsize=12)
+    ax.set_title("Comparative Signal Trends for Top Networks", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Time", fontsize=12)
+    ax.set_ylabel("Signal Strength (dBm)", fontsize=12)
     
     # Set y-axis limits and grid
-    plt.grid(True, alpha=0.3)
+    ax.grid(True, alpha=0.3)
     
-    # Show only some of the x-axis labels to avoid crowding
-    if top_networks and len(top_networks[0]["raw_data"]) > 10:
-        timestamps = [d[0] for d in top_networks[0]["raw_data"]]
-        step = len(timestamps) // 10
-        plt.xticks(range(0, len(timestamps), step), [timestamps[i] for i in range(0, len(timestamps), step)])
+    # Label the automatically placed ticks with the local time of day
+    ax.xaxis.set_major_formatter(FuncFormatter(lambda x, pos: format_clock_time(int(start + x))))
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     
     # Add signal quality zones
-    plt.axhspan(-50, 0, alpha=0.2, color='green', label='Excellent')
-    plt.axhspan(-70, -50, alpha=0.2, color='yellow', label='Good')
-    plt.axhspan(-90, -70, alpha=0.2, color='orange', label='Fair')
-    plt.axhspan(-100, -90, alpha=0.2, color='red', label='Poor')
+    zones = [
+        ax.axhspan(-50, 0, alpha=0.2, color='green', label='Excellent'),
+        ax.axhspan(-70, -50, alpha=0.2, color='yellow', label='Good'),
+        ax.axhspan(-90, -70, alpha=0.2, color='orange', label='Fair'),
+        ax.axhspan(-100, -90, alpha=0.2, color='red', label='Poor')
+    ]
     
-    # Add legend
-    plt.legend(loc='lower right')
+    # Add legend, with a line entry for each network in the collection
+    ax.legend(handles=legend_lines + zones, loc='lower right')
     
     # Adjust layout and save
-    plt.tight_layout()
+    fig.tight_layout()
     filename = f"{output_dir}/comparative_signal_trends.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(filename, dpi=120)
+    plt.close(fig)
     
     print(f"Comparative signal trends chart saved to {filename}")
 
 
+def capture_in_background(interface, duration, stop, errors, frames):
+    """Capture frames from a raw socket until the duration ends or stop is set
+
+    Args:
+        interface (str): Wireless interface to use
+        duration (float): Capture duration in seconds
+        stop (threading.Event): Ends the capture early once set
+        errors (list): Receives any exception raised by the capture
+        frames (collections.deque): Receives each captured (frame, timestamp) pair
+    """
+    # Only queue the frames here, so the socket is drained as fast as possible
+    append = frames.append
+    try:
+        raw_capture.capture_frames(interface, lambda frame, timestamp: append((frame, timestamp)),
+                                   timeout=duration, stop=stop, timestamps=True)
+    except Exception as e:
+        errors.append(e)
+
+
+def process_queued_frames(frames):
+    """Process every frame queued by the capture thread so far
+
+    Args:
+        frames (collections.deque): Queued (frame, timestamp) pairs
+    """
+    popleft = frames.popleft
+    while frames:
+        process_frame(*popleft())
+
+
+def print_progress(elapsed, duration):
+    """Print the analysis progress on a single updating line
+
+    Args:
+        elapsed (float): Seconds since the analysis started
+        duration (float): Analysis duration in seconds
+    """
+    progress = min(100, (elapsed / duration) * 100)
+    print(f"\rProgress: {progress:.1f}% - {len(networks)} networks analyzed", end="")
+
+
 def main():
     """Main function for the signal analyzer module"""
     parser = argparse.ArgumentParser(description="WifiObserver - Signal Analyzer")
@@ -399,8 +738,18 @@ def main():
     parser.add_argument("--output", "-o", default=None, help="Output file name")
     parser.add_argument("--interval", "-n", type=float, default=1.0, help="Sampling interval in seconds")
     parser.add_argument("--plot", "-p", action="store_true", help="Generate signal trend plots")
+    parser.add_argument("--slow", action="store_true", help="Capture through repeated scapy sniffs instead of the raw socket reader")
+    parser.add_argument("--max-samples-per-network", type=int, default=SIGNAL_HISTORY_SIZE,
+                        help="Signal samples kept per network; older samples are dropped once reached")
     args = parser.parse_args()
     
+    if args.max_samples_per_network < 1:
+        parser.error("--max-samples-per-network must be at least 1")
+    
+    # Size the signal buffers of newly seen networks
+    global history_size
+    history_size = args.max_samples_per_network
+    
     # Initialize analysis
     interface = initialize_analysis(args.interface)
     
@@ -413,25 +762,47 @@ def main():
         print(f"Starting signal analysis for {args.duration} seconds with {args.interval}s intervals...")
         print("Press Ctrl+C to stop analysis early")
         
-        # Main analysis loop
-        while current_time < end_time and not interrupted:
-            # Perform packet capture for a brief period
-            scapy.sniff(
-                iface=interface,
-                prn=process_packet,
-                store=False,
-                timeout=args.interval
-            )
+        if raw_capture.AVAILABLE and not args.slow:
+            # Capture continuously on one socket in the background, so no beacons are lost between updates
+            stop = threading.Event()
+            errors = []
+            frames = collections.deque(maxlen=FRAME_QUEUE_SIZE)
+            capture = threading.Thread(target=capture_in_background,
+                                       args=(interface, args.duration, stop, errors, frames), daemon=True)
+            capture.start()
             
-            # Update time for next iteration
-            current_time = time.time()
+            # Process queued frames in batches and report progress once per interval until the capture ends
+            next_progress = last_sample_time + args.interval
+            while capture.is_alive() and not interrupted:
+                capture.join(PROCESS_INTERVAL)
+                process_queued_frames(frames)
+                
+                current_time = time.time()
+                if current_time >= next_progress:
+                    print_progress(current_time - last_sample_time, args.duration)
+                    next_progress = current_time + args.interval
             
-            # Calculate progress
-            elapsed = current_time - last_sample_time
-            progress = min(100, (elapsed / args.duration) * 100)
-            
-            # Print progress
-            print(f"\rProgress: {progress:.1f}% - {len(networks)} networks analyzed", end="")
+            stop.set()
+            capture.join()
+            process_queued_frames(frames)
+            if errors:
+                raise errors[0]
+        else:
+            # Main analysis loop
+            while current_time < end_time and not interrupted:
+                # Perform packet capture for a brief period
+                scapy.sniff(
+                    iface=interface,
+                    prn=process_packet,
+                    store=False,
+                    timeout=args.interval
+                )
+                
+                # Update time for next iteration
+                current_time = time.time()
+                
+                # Print progress
+                print_progress(current_time - last_sample_time, args.duration)
         
         print("\n\nAnalysis completed")
         
@@ -441,8 +812,7 @@ def main():
         # Generate plots if requested
         if args.plot:
             # Load the report data
-            with open(report_path, "r") as f:
-                report_data = json.load(f)
+            report_data = load_json(report_path)
             
             # Create signal trend plots
             plot_signal_trends(report_data["networks"])
@@ -471,4 +841,5 @@ if __name__ == "__main__":
         print("Error: This script must be run as root (use sudo)")
         sys.exit(1)
     
+    use_file_backend()
     main()
\ No newline at end of file
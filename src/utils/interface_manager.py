@@ -19,6 +19,35 @@ import logging
 # Set up logging
 logger = logging.getLogger("interface_manager")
 
+# Kernel view of the network interfaces, read without spawning ip or iw
+SYSFS_NET = "/sys/class/net"
+SYSFS_AVAILABLE = os.path.isdir(SYSFS_NET)
+
+# Link type reported for interfaces in monitor mode
+ARPHRD_IEEE80211_RADIOTAP = 803
+
+# Patterns for the ip and iw output parsed when sysfs is unavailable
+IW_INTERFACE_PATTERN = re.compile(r"Interface\s+(\w+)")
+MAC_PATTERN = re.compile(r"link/ether\s+([0-9a-f:]{17})")
+
+
+def read_interface_attribute(interface, name):
+    """Read one sysfs attribute of a network interface
+
+    Args:
+        interface (str): The interface name
+        name (str): Attribute file name, e.g. "address"
+
+    Returns:
+        str: The attribute value, or None if it cannot be read
+    """
+    try:
+        with open(os.path.join(SYSFS_NET, interface, name)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
 def check_interface(interface):
     """Check if a network interface exists
 
@@ -28,6 +57,10 @@ def check_interface(interface):
     Returns:
         bool: True if interface exists, False otherwise
     """
+    if SYSFS_AVAILABLE:
+        # Every interface has an entry in sysfs
+        return interface in os.listdir(SYSFS_NET)
+    
     try:
         # Try to get interface info using ip command
         result = subprocess.run(
@@ -49,6 +82,13 @@ def list_wireless_interfaces():
     Returns:
         list: List of wireless interface names
     """
+    if SYSFS_AVAILABLE:
+        # Wireless interfaces link to their cfg80211 phy
+        return [
+            interface for interface in sorted(os.listdir(SYSFS_NET))
+            if os.path.exists(os.path.join(SYSFS_NET, interface, "phy80211"))
+        ]
+    
     try:
         # Use iw to list wireless interfaces
         result = subprocess.run(
@@ -65,7 +105,7 @@ def list_wireless_interfaces():
         # Parse the output to extract interface names
         interfaces = []
         for line in result.stdout.splitlines():
-            match = re.search(r"Interface\s+(\w+)", line)
+            match = IW_INTERFACE_PATTERN.search(line)
             if match:
                 interfaces.append(match.group(1))
         
@@ -84,6 +124,15 @@ def check_monitor_mode(interface):
     Returns:
         bool: True if interface is in monitor mode, False otherwise
     """
+    if SYSFS_AVAILABLE:
+        # Monitor interfaces deliver radiotap frames
+        link_type = read_interface_attribute(interface, "type")
+        if link_type is None:
+            logger.error(f"Error checking interface mode: cannot read {interface} link type")
+            return False
+        
+        return link_type == str(ARPHRD_IEEE80211_RADIOTAP)
+    
     try:
         # Use iw to check interface mode
         result = subprocess.run(
@@ -269,6 +318,15 @@ def get_interface_mac(interface):
     Returns:
         str: The MAC address or None if not found
     """
+    if SYSFS_AVAILABLE:
+        # Hardware address as colon separated hex
+        address = read_interface_attribute(interface, "address")
+        if address is None:
+            logger.error(f"Error getting interface info: cannot read {interface} address")
+            return None
+        
+        return address if len(address) == 17 else None
+    
     try:
         # Use ip command to get interface info
         result = subprocess.run(
@@ -284,7 +342,7 @@ def get_interface_mac(interface):
         
         # Parse MAC address from output
         for line in result.stdout.splitlines():
-            match = re.search(r"link/ether\s+([0-9a-f:]{17})", line)
+            match = MAC_PATTERN.search(line)
             if match:
                 return match.group(1)
         
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON Utilities
+
+This module provides JSON loading and saving helpers for the WifiObserver tool. It uses
+orjson when available and falls back to the standard library json module.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def array_to_list(value):
+    """Convert a numpy array to a list for the standard library json encoder
+
+    Args:
+        value (object): Value the encoder could not serialize
+
+    Returns:
+        list: The array's elements as Python numbers
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def load_json(input_file):
+    """Load data from a JSON file
+
+    Args:
+        input_file (str): Path to the input JSON file
+
+    Returns:
+        object: Parsed JSON data
+    """
+    with open(input_file, "rb") as f:
+        raw = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(data, output_file):
+    """Write data to a JSON file with two-space indentation
+
+    Args:
+        data (object): JSON-serializable data; numpy arrays are allowed
+        output_file (str): Path to the output JSON file
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        raw = json.dumps(data, indent=2, default=array_to_list).encode("utf-8")
+    
+    # Write beside the target and swap it in, so an interrupted write never leaves a truncated file
+    temp_file = output_file + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(raw)
+    os.replace(temp_file, output_file)
+
+
+def dumps_json(data):
+    """Serialize data to compact JSON bytes
+
+    Args:
+        data (object): JSON-serializable data; numpy arrays are allowed
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(",", ":"), default=array_to_list).encode("utf-8")
+
+
+def dump_json_records(output_file, metadata, records_key, records):
+    """Write a JSON object whose record list is serialized one record at a time
+
+    Only one record is encoded in memory at a time, and each record is written
+    on its own line.
+
+    Args:
+        output_file (str): Path to the output JSON file
+        metadata (dict): Top-level fields written before the records
+        records_key (str): Key of the record list
+        records (iterable): Records to write
+    """
+    # Write beside the target and swap it in, so an interrupted write never leaves a truncated file
+    temp_file = output_file + ".tmp"
+    with open(temp_file, "wb", buffering=1 << 20) as f:
+        # Write the metadata fields, leaving the object open for the records
+        f.write(b"{")
+        for key, value in metadata.items():
+            f.write(dumps_json(key) + b":" + dumps_json(value) + b",")
+        f.write(dumps_json(records_key) + b":[")
+        
+        # Stream the records, separating them with commas
+        separator = b"\n"
+        for record in records:
+            f.write(separator + dumps_json(record))
+            separator = b",\n"
+        
+        f.write(b"\n]}\n")
+    os.replace(temp_file, output_file)
\ No newline at end of file
@@ -8,12 +8,80 @@ This module provides functions for setting up logging and printing formatted
 output for the WifiObserver tool.
 """
 
+import atexit
+import io
 import logging
 import os
+import queue
 import sys
+import threading
+import time
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 import pyfiglet
 
+# ANSI color and style sequences
+RED = "\033[91m"
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+BOLD = "\033[1m"
+RESET = "\033[0m"
+
+# Colored prefix of each kind of status message
+ERROR_PREFIX = RED + "ERROR: "
+SUCCESS_PREFIX = GREEN + "✓ "
+WARNING_PREFIX = YELLOW + "! "
+INFO_PREFIX = BLUE + "i "
+
+# Log records held in memory before they are written to the log file
+LOG_BUFFER_CAPACITY = 1000
+
+# Seconds between flushes of the buffered log records
+LOG_FLUSH_INTERVAL = 30
+
+# Buffered file handlers, flushed together by one background thread
+buffered_handlers = []
+flush_thread = None
+
+# Background threads writing each logger's file records, by logger name
+log_listeners = {}
+
+
+def flush_log_buffers():
+    """Write out the records held by every buffered log handler"""
+    for handler in list(buffered_handlers):
+        handler.flush()
+
+
+def flush_periodically():
+    """Flush the buffered log handlers every LOG_FLUSH_INTERVAL seconds"""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        flush_log_buffers()
+
+
+def stop_log_listeners():
+    """Stop every background log writer after it has handled the records still queued"""
+    for listener in log_listeners.values():
+        listener.stop()
+    log_listeners.clear()
+
+
+# Drain the queues at exit, before logging's own shutdown flushes the file handlers
+atexit.register(stop_log_listeners)
+
+
+def start_flush_thread():
+    """Start the background thread that flushes buffered log records, once per process"""
+    global flush_thread
+    
+    if flush_thread is None:
+        flush_thread = threading.Thread(target=flush_periodically, name="log-flush", daemon=True)
+        flush_thread.start()
+
 
 def setup_logger(name, log_level=logging.INFO):
     """Set up a logger with file and console output
@@ -36,6 +104,14 @@ def setup_logger(name, log_level=logging.INFO):
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
     
+    # Stop any previous file writer for this logger, writing out anything it still holds
+    listener = log_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+            buffered_handlers.remove(handler)
+    
     # Clear any existing handlers
     if logger.handlers:
         logger.handlers.clear()
@@ -48,12 +124,24 @@ def setup_logger(name, log_level=logging.INFO):
     )
     file_handler.setFormatter(file_format)
     file_handler.setLevel(log_level)
-    logger.addHandler(file_handler)
+    
+    # Batch file writes in memory; errors, the periodic flush and interpreter exit write them out
+    buffered_handler = MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler)
+    buffered_handler.setLevel(log_level)
+    buffered_handlers.append(buffered_handler)
+    start_flush_thread()
+    
+    # Only queue records on the logging thread; a background thread does the file I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+    listener.start()
+    log_listeners[name] = listener
+    logger.addHandler(QueueHandler(log_queue))
     
     # Create console handler (only for errors and critical messages)
     console_handler = logging.StreamHandler(sys.stderr)
     console_format = logging.Formatter(
-        "\033[91m%(levelname)s\033[0m: %(message)s"  # Red text for errors
+        RED + "%(levelname)s" + RESET + ": %(message)s"  # Red text for errors
     )
     console_handler.setFormatter(console_format)
     console_handler.setLevel(logging.ERROR)
@@ -63,13 +151,25 @@ def setup_logger(name, log_level=logging.INFO):
     return logger
 
 
+@lru_cache(maxsize=None)
+def render_banner():
+    """Render the application banner, loading the figlet font only once per process
+
+    Returns:
+        str: Colored banner text
+    """
+    banner = pyfiglet.figlet_format("WifiObserver", font="slant")
+    return "\n".join([
+        BLUE + banner + RESET,  # Blue text
+        GREEN + "A Passive Wi-Fi Network Discovery Tool" + RESET,  # Green text
+        YELLOW + "Legal Use Only: No Unauthorized Access Attempted" + RESET,  # Yellow text
+        "-" * 60
+    ])
+
+
 def print_banner():
     """Print the application banner"""
-    banner = pyfiglet.figlet_format("WifiObserver", font="slant")
-    print("\033[94m" + banner + "\033[0m")  # Blue text
-    print("\033[92m" + "A Passive Wi-Fi Network Discovery Tool" + "\033[0m")  # Green text
-    print("\033[93m" + "Legal Use Only: No Unauthorized Access Attempted" + "\033[0m")  # Yellow text
-    print("-" * 60)
+    print(render_banner())
 
 
 def log_header(message):
@@ -78,9 +178,24 @@ def log_header(message):
     Args:
         message (str): Message to display in the header
     """
-    print_banner()
-    print("\033[1m" + message + "\033[0m")  # Bold text
-    print("-" * 60)
+    # Write the banner and the bold message in one call
+    sys.stdout.write(f"{render_banner()}\n{BOLD}{message}{RESET}\n{'-' * 60}\n")
+
+
+def render_section_header(title):
+    """Render a section header
+
+    Args:
+        title (str): Section title
+
+    Returns:
+        str: Header lines, ending with a newline
+    """
+    return "\n".join([
+        "\n" + "=" * 60,
+        f"{BOLD}{title}{RESET}".center(60),  # Bold and centered
+        "=" * 60
+    ]) + "\n"
 
 
 def print_section_header(title):
@@ -89,9 +204,7 @@ def print_section_header(title):
     Args:
         title (str): Section title
     """
-    print("\n" + "=" * 60)
-    print(f"\033[1m{title}\033[0m".center(60))  # Bold and centered
-    print("=" * 60)
+    sys.stdout.write(render_section_header(title))
 
 
 def print_network_summary(networks, hidden_count):
@@ -101,51 +214,48 @@ def print_network_summary(networks, hidden_count):
         networks (dict): Dictionary of discovered networks
         hidden_count (int): Number of hidden networks
     """
-    print_section_header("NETWORK SUMMARY")
+    # Build the whole summary in memory and write it in one call
+    out = io.StringIO()
+    out.write(render_section_header("NETWORK SUMMARY"))
     
     total = len(networks)
     
-    # Count network types
-    types = {
-        "POSSIBLE_OFFICIAL": 0,
-        "ENTERPRISE": 0,
-        "MOBILE_HOTSPOT": 0,
-        "PUBLIC": 0,
-        "STANDARD": 0
-    }
-    
-    # Count encryption types
-    encryption = {
-        "Open": 0,
-        "WEP": 0,
-        "WPA": 0,
-        "WPA2/WPA3": 0
-    }
+    # Count network and encryption types; missing keys read as zero
+    types = Counter(network.get("type", "STANDARD") for network in networks.values())
+    encryption = Counter(network.get("encryption", "Unknown") for network in networks.values())
     
-    for network in networks.values():
-        types[network.get("type", "STANDARD")] += 1
-        encryption[network.get("encryption", "Unknown")] = encryption.get(network.get("encryption", "Unknown"), 0) + 1
+    # Summary
+    out.write(f"Total Networks: {BOLD}{total}{RESET}\n")
+    out.write(f"Hidden Networks: {BOLD}{hidden_count}{RESET}\n")
     
-    # Print summary
-    print(f"Total Networks: \033[1m{total}\033[0m")
-    print(f"Hidden Networks: \033[1m{hidden_count}\033[0m")
+    # Network types
+    out.write("\nNetwork Types:\n")
+    out.write(f"  - {RED}Possible Official/Gov: {types['POSSIBLE_OFFICIAL']}{RESET}\n")
+    out.write(f"  - {BLUE}Enterprise: {types['ENTERPRISE']}{RESET}\n")
+    out.write(f"  - {GREEN}Mobile Hotspots: {types['MOBILE_HOTSPOT']}{RESET}\n")
+    out.write(f"  - {YELLOW}Public: {types['PUBLIC']}{RESET}\n")
+    out.write(f"  - Standard/Other: {types['STANDARD']}\n")
     
-    # Print network types
-    print("\nNetwork Types:")
-    print(f"  - \033[91mPossible Official/Gov: {types['POSSIBLE_OFFICIAL']}\033[0m")
-    print(f"  - \033[94mEnterprise: {types['ENTERPRISE']}\033[0m")
-    print(f"  - \033[92mMobile Hotspots: {types['MOBILE_HOTSPOT']}\033[0m")
-    print(f"  - \033[93mPublic: {types['PUBLIC']}\033[0m")
-    print(f"  - Standard/Other: {types['STANDARD']}")
+    # Encryption types
+    out.write("\nEncryption Types:\n")
+    out.write(f"  - Open (No Encryption): {encryption['Open']}\n")
+    out.write(f"  - WEP (Insecure): {encryption['WEP']}\n")
+    out.write(f"  - WPA: {encryption['WPA']}\n")
+    out.write(f"  - WPA2/WPA3: {encryption['WPA2/WPA3']}\n")
     
-    # Print encryption types
-    print("\nEncryption Types:")
-    print(f"  - Open (No Encryption): {encryption['Open']}")
-    print(f"  - WEP (Insecure): {encryption['WEP']}")
-    print(f"  - WPA: {encryption['WPA']}")
-    print(f"  - WPA2/WPA3: {encryption['WPA2/WPA3']}")
+    out.write("\n" + "-" * 60 + "\n")
     
-    print("\n" + "-" * 60)
+    sys.stdout.write(out.getvalue())
+
+
+def write_status(prefix, message):
+    """Write a colored status message to stdout in a single write
+
+    Args:
+        prefix (str): Color sequence and marker starting the line
+        message (str): Message to display
+    """
+    sys.stdout.write(f"{prefix}{message}{RESET}\n")
 
 
 def print_error(message):
@@ -154,7 +264,7 @@ def print_error(message):
     Args:
         message (str): Error message to display
     """
-    print(f"\033[91mERROR: {message}\033[0m")  # Red error text
+    write_status(ERROR_PREFIX, message)  # Red error text
 
 
 def print_success(message):
@@ -163,7 +273,7 @@ def print_success(message):
     Args:
         message (str): Success message to display
     """
-    print(f"\033[92m✓ {message}\033[0m")  # Green success text
+    write_status(SUCCESS_PREFIX, message)  # Green success text
 
 
 def print_warning(message):
@@ -172,7 +282,7 @@ def print_warning(message):
     Args:
         message (str): Warning message to display
     """
-    print(f"\033[93m! {message}\033[0m")  # Yellow warning text
+    write_status(WARNING_PREFIX, message)  # Yellow warning text
 
 
 def print_info(message):
@@ -181,7 +291,7 @@ def print_info(message):
     Args:
         message (str): Info message to display
     """
-    print(f"\033[94mi {message}\033[0m")  # Blue info text
+    write_status(INFO_PREFIX, message)  # Blue info text
 
 
 if __name__ == "__main__":
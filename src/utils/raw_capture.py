@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Raw Capture Utility
+
+This module provides a lightweight capture path for 802.11 management frames.
+It reads radiotap-encapsulated frames from a Linux AF_PACKET socket and
+extracts the few fields WifiObserver needs with struct, without building a
+scapy packet for every frame.
+"""
+
+import socket
+import struct
+import time
+from functools import lru_cache
+
+# Capture every protocol on the socket
+ETH_P_ALL = 0x0003
+
+# Largest frame read from the socket
+RECV_SIZE = 65535
+
+# Seconds a read may block before the capture deadline is checked again
+POLL_INTERVAL = 0.5
+
+# AF_PACKET sockets are only available on Linux
+AVAILABLE = hasattr(socket, "AF_PACKET")
+
+# 802.11 management frame subtypes, as the first frame control byte
+BEACON = 0x80
+PROBE_RESPONSE = 0x50
+
+# Management header plus the timestamp, beacon interval and capability fields
+FIXED_FIELDS_END = 36
+
+# Capability bit set when the network requires encryption
+CAPABILITY_PRIVACY = 0x0010
+
+# Radiotap fields that precede the dBm antenna signal, as (alignment, size) by present bit
+RADIOTAP_FIELDS = ((8, 8), (1, 1), (1, 1), (2, 4), (2, 2))
+RADIOTAP_FLAGS_BIT = 1
+RADIOTAP_SIGNAL_BIT = 5
+
+# Radiotap flag set when the frame ends with a 4-byte FCS
+RADIOTAP_FLAG_FCS = 0x10
+
+# Vendor specific IE prefix announcing WPA (Microsoft OUI, type 1)
+WPA_VENDOR_PREFIX = b"\x00\x50\xf2\x01"
+
+# Socket option and control message type for kernel receive timestamps (Linux value)
+SO_TIMESTAMP = getattr(socket, "SO_TIMESTAMP", 29)
+
+RADIOTAP_HEADER = struct.Struct("<BxHI")
+CAPABILITY = struct.Struct("<H")
+TIMEVAL = struct.Struct("@ll")
+
+# Room for one timestamp control message
+ANCILLARY_SIZE = socket.CMSG_SPACE(TIMEVAL.size) if hasattr(socket, "CMSG_SPACE") else 0
+
+
+def open_raw_socket(interface):
+    """Open a raw packet socket bound to an interface
+
+    Args:
+        interface (str): Interface in monitor mode
+
+    Returns:
+        socket.socket: Bound raw socket
+    """
+    sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+    sock.bind((interface, 0))
+    return sock
+
+
+@lru_cache(maxsize=256)
+def radiotap_field_offsets(present, offset):
+    """Locate the flags and antenna signal fields for a radiotap present bitmap
+
+    Adapters repeat the same few present bitmaps, so each layout is only walked once.
+
+    Args:
+        present (int): First radiotap present bitmap
+        offset (int): Offset of the first field, after any extended bitmaps
+
+    Returns:
+        tuple: (flags offset or None, antenna signal offset or None)
+    """
+    # Walk the aligned fields up to the antenna signal
+    flags_offset = None
+    for bit, (alignment, size) in enumerate(RADIOTAP_FIELDS):
+        if present & (1 << bit):
+            offset = (offset + alignment - 1) & ~(alignment - 1)
+            if bit == RADIOTAP_FLAGS_BIT:
+                flags_offset = offset
+            offset += size
+    
+    signal_offset = offset if present & (1 << RADIOTAP_SIGNAL_BIT) else None
+    return flags_offset, signal_offset
+
+
+def parse_radiotap(frame):
+    """Parse the radiotap header of a captured frame
+
+    Args:
+        frame (bytes): Captured frame
+
+    Returns:
+        tuple: (header length, signal in dBm or None, FCS present), or None if not radiotap
+    """
+    if len(frame) < RADIOTAP_HEADER.size:
+        return None
+    
+    version, header_length, present = RADIOTAP_HEADER.unpack_from(frame)
+    if version != 0 or header_length > len(frame):
+        return None
+    
+    # Skip any extended present bitmaps
+    offset = RADIOTAP_HEADER.size
+    word = present
+    while word & 0x80000000 and offset + 4 <= header_length:
+        word, = struct.unpack_from("<I", frame, offset)
+        offset += 4
+    
+    # Read the flags and antenna signal at their cached offsets
+    flags_offset, signal_offset = radiotap_field_offsets(present, offset)
+    has_fcs = flags_offset is not None and flags_offset < header_length and bool(frame[flags_offset] & RADIOTAP_FLAG_FCS)
+    signal = None
+    if signal_offset is not None and signal_offset < header_length:
+        signal = struct.unpack_from("b", frame, signal_offset)[0]
+    
+    return header_length, signal, has_fcs
+
+
+def parse_ies(frame, offset, end):
+    """Parse the tagged information elements of a management frame
+
+    Args:
+        frame (bytes): Captured frame
+        offset (int): Offset of the first element
+        end (int): Offset just past the last element
+
+    Returns:
+        tuple: (first element body, dict of element ID to first body, list of vendor element bodies)
+    """
+    first = None
+    elements = {}
+    vendor = []
+    
+    while offset + 2 <= end:
+        element_id = frame[offset]
+        length = frame[offset + 1]
+        body = frame[offset + 2:offset + 2 + length]
+        if len(body) < length:
+            break
+        
+        if first is None:
+            first = body
+        if element_id == 221:
+            vendor.append(body)
+        elements.setdefault(element_id, body)
+        offset += 2 + length
+    
+    return first, elements, vendor
+
+
+def parse_frame(frame):
+    """Parse a captured beacon or probe response frame
+
+    Args:
+        frame (bytes): Captured radiotap frame
+
+    Returns:
+        dict: Frame fields, or None if the frame is not a beacon or probe response
+    """
+    radiotap = parse_radiotap(frame)
+    if radiotap is None:
+        return None
+    
+    header_length, signal, has_fcs = radiotap
+    end = len(frame) - 4 if has_fcs else len(frame)
+    if end < header_length + FIXED_FIELDS_END:
+        return None
+    
+    subtype = frame[header_length]
+    if subtype != BEACON and subtype != PROBE_RESPONSE:
+        return None
+    
+    # The transmitter address is the BSSID for beacons and probe responses
+    bssid = frame[header_length + 10:header_length + 16].hex(":")
+    capability, = CAPABILITY.unpack_from(frame, header_length + 34)
+    first, elements, vendor = parse_ies(frame, header_length + FIXED_FIELDS_END, end)
+    
+    return {
+        "beacon": subtype == BEACON,
+        "bssid": bssid,
+        "signal": signal,
+        "privacy": bool(capability & CAPABILITY_PRIVACY),
+        "first_ie": first,
+        "ies": elements,
+        "vendor": vendor
+    }
+
+
+def parse_beacon(frame):
+    """Extract only the BSSID, signal and SSID of a captured beacon frame
+
+    Args:
+        frame (bytes): Captured radiotap frame
+
+    Returns:
+        tuple: (BSSID as 6 bytes, signal in dBm or None, SSID bytes or None), or None if the frame is not a beacon
+    """
+    radiotap = parse_radiotap(frame)
+    if radiotap is None:
+        return None
+    
+    header_length, signal, has_fcs = radiotap
+    end = len(frame) - 4 if has_fcs else len(frame)
+    if end < header_length + FIXED_FIELDS_END or frame[header_length] != BEACON:
+        return None
+    
+    # The SSID is the first tagged element, so the rest need not be walked
+    offset = header_length + FIXED_FIELDS_END
+    ssid = None
+    if offset + 2 <= end and offset + 2 + frame[offset + 1] <= end:
+        ssid = frame[offset + 2:offset + 2 + frame[offset + 1]]
+    
+    return frame[header_length + 10:header_length + 16], signal, ssid
+
+
+def read_timestamp(ancdata):
+    """Extract the kernel receive timestamp from a frame's control messages
+
+    Args:
+        ancdata (list): Control messages returned by socket.recvmsg
+
+    Returns:
+        float: Receive time as a Unix timestamp, or the current time if the kernel sent none
+    """
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMP and len(data) >= TIMEVAL.size:
+            seconds, microseconds = TIMEVAL.unpack_from(data)
+            return seconds + microseconds / 1e6
+    
+    return time.time()
+
+
+def capture_frames(interface, handler, timeout=None, stop=None, timestamps=False):
+    """Read frames from an interface and pass each one to a handler
+
+    Args:
+        interface (str): Interface in monitor mode
+        handler (callable): Called with each captured frame as bytes
+        timeout (float, optional): Capture duration in seconds. Defaults to None (until interrupted).
+        stop (threading.Event, optional): Ends the capture early once set. Defaults to None.
+        timestamps (bool, optional): Also pass the kernel receive time of each frame to the handler. Defaults to False.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    sock = open_raw_socket(interface)
+    
+    # Wake up periodically so the deadline is honored on a quiet channel
+    sock.settimeout(POLL_INTERVAL)
+    
+    # Have the kernel attach its receive time to every frame
+    if timestamps:
+        sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMP, 1)
+    
+    try:
+        recv = sock.recv
+        recvmsg = sock.recvmsg
+        while (deadline is None or time.monotonic() < deadline) and not (stop is not None and stop.is_set()):
+            try:
+                if timestamps:
+                    frame, ancdata, _, _ = recvmsg(RECV_SIZE, ANCILLARY_SIZE)
+                else:
+                    frame = recv(RECV_SIZE)
+            except socket.timeout:
+                continue
+            
+            if timestamps:
+                handler(frame, read_timestamp(ancdata))
+            else:
+                handler(frame)
+    finally:
+        sock.close()
\ No newline at end of file
@@ -10,13 +10,16 @@ by only performing passive scanning without attempting to connect to networks.
 """
 
 import argparse
-import json
+import atexit
+import io
+import logging
 import os
+import re
 import signal
 import sys
+import threading
 import time
 from datetime import datetime
-from pathlib import Path
 
 try:
     import scapy.all as scapy
@@ -24,30 +27,147 @@ except ImportError:
     print("Error: Scapy library not found. Please install it using 'pip install scapy'")
     sys.exit(1)
 
+try:
+    from scapy.arch.common import compile_filter
+except ImportError:
+    compile_filter = None
+
+try:
+    from manuf import manuf
+except ImportError:
+    manuf = None
+
 # Add parent directory to path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.utils.interface_manager import set_monitor_mode, check_interface
+from src.utils.json_utils import dump_json
 from src.utils.logging_utils import setup_logger, log_header
+from src.utils.raw_capture import WPA_VENDOR_PREFIX, parse_frame, parse_ies
 
 # Initialize logger
 logger = setup_logger("wifi_scanner")
 
+# RSN AKM suite selectors for SAE, FT-SAE and SAE with extended keys (OUI 00-0F-AC), which mark WPA3-Personal
+SAE_AKM_SUITES = {b"\x00\x0f\xac\x08", b"\x00\x0f\xac\x09", b"\x00\x0f\xac\x18", b"\x00\x0f\xac\x19"}
+
+# Discovered networks are printed in batches of this many lines, or after this many seconds
+OUTPUT_FLUSH_LINES = 16
+OUTPUT_FLUSH_INTERVAL = 0.5
+
+# Colored label for each network type; other types print as STANDARD
+TYPE_LABELS = {
+    "POSSIBLE_OFFICIAL": "\033[91mPOSSIBLE_OFFICIAL\033[0m",  # Red
+    "ENTERPRISE": "\033[94mENTERPRISE\033[0m",  # Blue
+    "MOBILE_HOTSPOT": "\033[92mMOBILE_HOTSPOT\033[0m",  # Green
+    "PUBLIC": "\033[93mPUBLIC\033[0m"  # Yellow
+}
+
+# Signal strength bars for signals above each threshold, strongest first
+SIGNAL_BARS = [(-50, "▂▄▆█"), (-65, "▂▄▆_"), (-75, "▂▄__"), (-85, "▂___")]
+
+# SSID substrings for each network type, checked in order on the uppercased SSID
+CLASSIFICATION_RULES = [
+    ("POSSIBLE_OFFICIAL", ["FBI", "GOV", "POLICE", "FED", "MIL", "DOD", "SECURE"]),
+    ("ENTERPRISE", ["CORP", "ENTERPRISE", "STAFF", "EMPLOYEE"]),
+    ("MOBILE_HOTSPOT", ["IPHONE", "ANDROID", "GALAXY", "MOBILE", "HOTSPOT"]),
+    ("PUBLIC", ["PUBLIC", "GUEST", "FREE", "WIFI"])
+]
+
+# One compiled alternation per network type
+CLASSIFICATION_PATTERNS = [
+    (network_type, re.compile("|".join(map(re.escape, patterns))))
+    for network_type, patterns in CLASSIFICATION_RULES
+]
+
+# Seconds between background saves of a running scan
+AUTOSAVE_INTERVAL = 60
+
+# Kernel-side filter keeping only beacons and probe responses
+CAPTURE_FILTER = "type mgt subtype beacon or type mgt subtype probe-resp"
+
+# Format of the times written to the results file
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Line printed for each discovered network
+NETWORK_LINE = "Found: %s%s (%s) | Ch: %s | Enc: %s | Sig: %s dBm %s | Type: %s"
+
 # Global variables
 networks = {}
 hidden_networks = set()
 start_time = None
 output_file = None
 
+# Scan output waiting to be written to stdout
+output_buffer = io.StringIO()
+output_lines = 0
+output_lock = threading.Lock()
+output_thread = None
+
+# OUI database parser, loaded on the first manufacturer lookup
+mac_parser = None
+
+# Serializes the background and final saves of the results file
+save_lock = threading.RLock()
+
+# Set before the final save, so no autosave starts after it
+autosave_stop = threading.Event()
+
+
+def write_output(line):
+    """Queue a line of scan output, writing the batch once it is full
+
+    Args:
+        line (str): Line to print, without a trailing newline
+    """
+    global output_lines, output_thread
+    
+    with output_lock:
+        output_buffer.write(line + "\n")
+        output_lines += 1
+        full = output_lines >= OUTPUT_FLUSH_LINES
+    
+    if full:
+        flush_output()
+    
+    # Start the background flush on first use, so a quiet scan still shows its last networks
+    if output_thread is None:
+        output_thread = threading.Thread(target=flush_output_periodically, name="output-flush", daemon=True)
+        output_thread.start()
+
+
+def flush_output():
+    """Write any queued scan output to stdout"""
+    global output_lines
+    
+    with output_lock:
+        if not output_lines:
+            return
+        text = output_buffer.getvalue()
+        output_buffer.seek(0)
+        output_buffer.truncate()
+        output_lines = 0
+        
+        # Write under the lock so batches from different threads keep their order
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def flush_output_periodically():
+    """Flush the queued scan output every OUTPUT_FLUSH_INTERVAL seconds"""
+    while True:
+        time.sleep(OUTPUT_FLUSH_INTERVAL)
+        flush_output()
+
+
+# Never lose queued output at exit
+atexit.register(flush_output)
+
 
 def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
-    print("\n\nScan interrupted. Shutting down gracefully...")
-    if output_file:
-        save_results(output_file)
-    print(f"Discovered {len(networks)} networks ({len(hidden_networks)} hidden)")
-    print("Exiting...")
-    sys.exit(0)
+    """Handle Ctrl+C by unwinding to the caller's interrupt handling"""
+    # The interrupted code may hold output_lock, so flushing and saving happen in the caller's except path
+    raise KeyboardInterrupt
 
 
 def initialize_scan(interface):
@@ -69,7 +189,7 @@ def initialize_scan(interface):
     signal.signal(signal.SIGINT, signal_handler)
     
     log_header(f"Starting Wi-Fi scan on interface {interface}")
-    logger.info(f"Scan initiated at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("Scan initiated at %s", start_time.strftime("%Y-%m-%d %H:%M:%S"))
     logger.info("Press Ctrl+C to stop scanning and save results")
     
     return interface
@@ -77,46 +197,118 @@ def initialize_scan(interface):
 
 def process_packet(packet):
     """Process captured packets to identify networks"""
+    # Read the clock once for everything this packet updates
+    now = time.time()
+    
     # Check if packet has a Beacon layer (standard networks)
     if packet.haslayer(scapy.Dot11Beacon):
-        process_beacon(packet)
+        process_beacon(packet, now)
     # Check for Probe Responses (can reveal hidden networks)
     elif packet.haslayer(scapy.Dot11ProbeResp):
-        process_probe_response(packet)
+        process_probe_response(packet, now)
     
 
-def process_beacon(packet):
+def process_beacon(packet, now):
     """Process beacon frames to identify networks"""
     # Extract the network MAC
     bssid = packet[scapy.Dot11].addr2
-    if bssid in networks:
+    network = networks.get(bssid)
+    if network is not None:
         # Update signal strength
-        networks[bssid]["signal"] = get_signal_strength(packet)
-        networks[bssid]["last_seen"] = time.time()
+        update_network(network, get_signal_strength(packet), now)
         return
-        
+    
+    # Parse the information elements once from the captured bytes
+    first_ie, elements, vendor = collect_ies(packet)
+    
     # Extract the network name (SSID)
+    try:
+        ssid = first_ie.decode("utf-8")
+    except:
+        ssid = "Unknown"
+    
+    # Get the channel, encryption type and signal strength from the parsed elements
+    channel = get_channel(elements)
+    encryption = get_encryption(packet[scapy.Dot11Beacon].cap.privacy, elements, vendor)
+    signal = get_signal_strength(packet)
+    
+    # Store the network
+    record_network(bssid, ssid, channel, encryption, signal, now)
+
+
+def process_probe_response(packet, now):
+    """Process probe response frames to potentially uncover hidden networks"""
+    bssid = packet[scapy.Dot11].addr2
+    
     try:
         ssid = packet[scapy.Dot11Elt].info.decode("utf-8")
+    except:
+        return  # Invalid SSID
+    
+    reveal_hidden_network(bssid, ssid, now)
+
+
+def process_packet_raw(frame):
+    """Process a raw radiotap frame without building a scapy packet"""
+    fields = parse_frame(frame)
+    if fields is None:
+        return
+    
+    # Read the clock once for everything this frame updates
+    now = time.time()
+    
+    bssid = fields["bssid"]
+    signal = fields["signal"] if fields["signal"] is not None else -100
+    first_ie = fields["first_ie"]
+    
+    # Probe responses can reveal hidden networks
+    if not fields["beacon"]:
+        try:
+            ssid = first_ie.decode("utf-8")
+        except:
+            return  # Invalid SSID
+        reveal_hidden_network(bssid, ssid, now)
+        return
+    
+    network = networks.get(bssid)
+    if network is not None:
+        # Update signal strength
+        update_network(network, signal, now)
+        return
+    
+    # Extract the network name (SSID)
+    try:
+        ssid = first_ie.decode("utf-8")
     except:
         ssid = "Unknown"
     
+    # Get the channel and encryption type from the parsed elements
+    channel = get_channel(fields["ies"])
+    encryption = get_encryption(fields["privacy"], fields["ies"], fields["vendor"])
+    
+    # Store the network
+    record_network(bssid, ssid, channel, encryption, signal, now)
+
+
+def update_network(network, signal, now):
+    """Refresh the signal strength and last seen time of a known network"""
+    network["signal"] = signal
+    network["last_seen"] = now
+
+
+def record_network(bssid, ssid, channel, encryption, signal, now):
+    """Store and log a newly discovered network"""
+    # Intern the strings so repeated SSIDs and manufacturers share one object
+    bssid = sys.intern(bssid)
+    ssid = sys.intern(ssid)
+    
     # Handle hidden networks (empty SSID)
     if ssid == "" or not ssid:
         ssid = "[Hidden Network]"
         hidden_networks.add(bssid)
     
-    # Get the channel
-    channel = get_channel(packet)
-    
-    # Get encryption type
-    encryption = get_encryption(packet)
-    
-    # Get signal strength
-    signal = get_signal_strength(packet)
-    
     # Get manufacturer (if available)
-    manufacturer = get_manufacturer(bssid)
+    manufacturer = sys.intern(get_manufacturer(bssid))
     
     # Store the network
     networks[bssid] = {
@@ -126,8 +318,8 @@ def process_beacon(packet):
         "encryption": encryption,
         "signal": signal,
         "manufacturer": manufacturer,
-        "first_seen": time.time(),
-        "last_seen": time.time(),
+        "first_seen": now,
+        "last_seen": now,
         "hidden": ssid == "[Hidden Network]",
         "type": classify_network(ssid, bssid, encryption, manufacturer)
     }
@@ -136,61 +328,57 @@ def process_beacon(packet):
     print_network(networks[bssid])
 
 
-def process_probe_response(packet):
-    """Process probe response frames to potentially uncover hidden networks"""
-    bssid = packet[scapy.Dot11].addr2
-    
-    try:
-        ssid = packet[scapy.Dot11Elt].info.decode("utf-8")
-    except:
-        return  # Invalid SSID
-    
+def reveal_hidden_network(bssid, ssid, now):
+    """Fill in the SSID of a hidden network seen in a probe response"""
     # If this is a known hidden network and we now have its SSID
     if bssid in hidden_networks and ssid and ssid != "[Hidden Network]":
         if bssid in networks:
             # Update the network with actual SSID
-            networks[bssid]["ssid"] = ssid
+            networks[bssid]["ssid"] = sys.intern(ssid)
             networks[bssid]["hidden"] = False
-            networks[bssid]["last_seen"] = time.time()
+            networks[bssid]["last_seen"] = now
             hidden_networks.remove(bssid)
             
-            # Log the discovery of a hidden network
-            logger.info(f"Uncovered hidden network: {ssid} ({bssid})")
-            print(f"✓ Uncovered hidden network: {ssid} ({bssid})")
+            # Log the discovery of a hidden network, formatting only if the record is kept
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Uncovered hidden network: %s (%s)", ssid, bssid)
+            write_output(f"✓ Uncovered hidden network: {ssid} ({bssid})")
+
 
+def collect_ies(packet):
+    """Parse the information elements from the beacon's bytes, returning the first element body, the first body of each ID and every vendor element body"""
+    # Dissected packets keep their captured bytes, so scapy's element layers need not be walked
+    payload = packet[scapy.Dot11Beacon].payload
+    raw = getattr(payload, "original", None) or bytes(payload)
+    return parse_ies(raw, 0, len(raw))
 
-def get_channel(packet):
-    """Extract channel information from packet"""
+
+def get_channel(elements):
+    """Extract channel information from the collected elements"""
     channel = 0
     
     # DS Parameter Set IE
-    curr = packet[scapy.Dot11Elt]
-    while curr and curr.ID != 3:
-        curr = curr.payload
-    
-    if curr and curr.ID == 3 and curr.len == 1:
-        channel = ord(curr.info)
+    body = elements.get(3)
+    if body is not None and len(body) == 1:
+        channel = body[0]
     
     return channel
 
 
-def get_encryption(packet):
-    """Determine encryption type from packet"""
+def get_encryption(privacy, elements, vendor):
+    """Determine encryption type from the privacy capability bit and the collected elements"""
     encryption = "Open"
     
-    # Check for encryption in the capability field
-    capability = packet.sprintf("{Dot11Beacon:%Dot11Beacon.cap%}")
-    
-    if "privacy" in capability:
+    if privacy:
         # Check for RSN (WPA2) information
-        rsn = get_rsn_info(packet)
+        rsn = get_rsn_info(elements)
         if rsn:
-            if "CCMP" in rsn:
+            if SAE_AKM_SUITES.intersection(get_akm_suites(rsn)):
                 encryption = "WPA2/WPA3"
             else:
                 encryption = "WPA2"
         # Check for WPA information
-        elif get_wpa_info(packet):
+        elif get_wpa_info(vendor):
             encryption = "WPA"
         # If privacy bit is set but no WPA/WPA2, it's WEP
         else:
@@ -199,25 +387,26 @@ def get_encryption(packet):
     return encryption
 
 
-def get_rsn_info(packet):
-    """Extract RSN (WPA2) information"""
-    curr = packet[scapy.Dot11Elt]
-    while curr and curr.ID != 48:
-        curr = curr.payload
-    
-    if curr and curr.ID == 48:
-        return curr.info.hex()
-    
-    return None
+def get_rsn_info(elements):
+    """Extract the RSN (WPA2) element body from the collected elements"""
+    return elements.get(48)
+
 
+def get_akm_suites(rsn):
+    """List the AKM suite selectors of an RSN element body"""
+    # Version, group cipher suite and the pairwise cipher suite list come first
+    pairwise_count = int.from_bytes(rsn[6:8], "little")
+    offset = 8 + 4 * pairwise_count
+    akm_count = int.from_bytes(rsn[offset:offset + 2], "little")
+    start = offset + 2
+    return [rsn[pos:pos + 4] for pos in range(start, min(start + 4 * akm_count, len(rsn) - 3), 4)]
 
-def get_wpa_info(packet):
-    """Extract WPA information"""
-    curr = packet[scapy.Dot11Elt]
-    while curr:
-        if curr.ID == 221 and curr.info.startswith(b"\x00\x50\xf2\x01"):
+
+def get_wpa_info(vendor):
+    """Check the collected vendor specific elements for WPA information"""
+    for body in vendor:
+        if body.startswith(WPA_VENDOR_PREFIX):
             return True
-        curr = curr.payload
     
     return False
 
@@ -225,17 +414,21 @@ def get_wpa_info(packet):
 def get_signal_strength(packet):
     """Extract signal strength from packet"""
     # This is a vendor-specific extension for Linux, might not work on all setups
-    if hasattr(packet, "dBm_AntSignal"):
-        return packet.dBm_AntSignal
-    return -100  # Default value if not available
+    return getattr(packet, "dBm_AntSignal", -100)  # Default value if not available
 
 
 def get_manufacturer(mac):
     """Attempt to identify manufacturer from MAC address"""
+    global mac_parser
+    
+    if manuf is None:
+        return "Unknown"
+    
     try:
-        from manuf import manuf
-        p = manuf.MacParser()
-        manufacturer = p.get_manuf(mac)
+        # Parsing the OUI database is slow, so it is only done once
+        if mac_parser is None:
+            mac_parser = manuf.MacParser()
+        manufacturer = mac_parser.get_manuf(mac)
         return manufacturer if manufacturer else "Unknown"
     except:
         return "Unknown"
@@ -245,21 +438,11 @@ def classify_network(ssid, bssid, encryption, manufacturer):
     """Attempt to classify the network type based on characteristics"""
     # This is a simple heuristic classification and is not definitive
     
-    # Check for common government/official naming patterns
-    if any(pattern in ssid.upper() for pattern in ["FBI", "GOV", "POLICE", "FED", "MIL", "DOD", "SECURE"]):
-        return "POSSIBLE_OFFICIAL"
-    
-    # Check for common enterprise patterns
-    if any(pattern in ssid.upper() for pattern in ["CORP", "ENTERPRISE", "STAFF", "EMPLOYEE"]):
-        return "ENTERPRISE"
-    
-    # Check for mobile hotspots
-    if any(pattern in ssid.upper() for pattern in ["IPHONE", "ANDROID", "GALAXY", "MOBILE", "HOTSPOT"]):
-        return "MOBILE_HOTSPOT"
-    
-    # Check for common public networks
-    if any(pattern in ssid.upper() for pattern in ["PUBLIC", "GUEST", "FREE", "WIFI"]):
-        return "PUBLIC"
+    # Check each type's naming patterns in priority order, uppercasing the SSID once
+    upper_ssid = ssid.upper()
+    for network_type, pattern in CLASSIFICATION_PATTERNS:
+        if pattern.search(upper_ssid):
+            return network_type
     
     # Default classification
     return "STANDARD"
@@ -267,74 +450,88 @@ def classify_network(ssid, bssid, encryption, manufacturer):
 
 def print_network(network):
     """Print information about a discovered network"""
-    ssid = network["ssid"]
-    bssid = network["bssid"]
-    channel = network["channel"]
-    encryption = network["encryption"]
     signal = network["signal"]
-    network_type = network["type"]
-    hidden = network["hidden"]
-    
-    # Color coding based on network type
-    if network_type == "POSSIBLE_OFFICIAL":
-        type_str = "\033[91mPOSSIBLE_OFFICIAL\033[0m"  # Red
-    elif network_type == "ENTERPRISE":
-        type_str = "\033[94mENTERPRISE\033[0m"  # Blue
-    elif network_type == "MOBILE_HOTSPOT":
-        type_str = "\033[92mMOBILE_HOTSPOT\033[0m"  # Green
-    elif network_type == "PUBLIC":
-        type_str = "\033[93mPUBLIC\033[0m"  # Yellow
-    else:
-        type_str = "STANDARD"
     
     # Signal strength indicator
-    if signal > -50:
-        signal_str = "▂▄▆█"
-    elif signal > -65:
-        signal_str = "▂▄▆_"
-    elif signal > -75:
-        signal_str = "▂▄__"
-    elif signal > -85:
-        signal_str = "▂___"
-    else:
-        signal_str = "____"
-    
-    # Hidden network indicator
-    hidden_str = " [HIDDEN]" if hidden else ""
-    
-    print(f"Found: {ssid}{hidden_str} ({bssid}) | Ch: {channel} | Enc: {encryption} | Sig: {signal} dBm {signal_str} | Type: {type_str}")
-
-
-def save_results(filename):
-    """Save scan results to a JSON file"""
-    output_dir = "data"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    output_path = os.path.join(output_dir, filename)
-    
-    # Convert network dict to a list for JSON serialization
-    network_list = []
-    for bssid, network in networks.items():
-        # Convert time values to readable format
-        network["first_seen"] = datetime.fromtimestamp(network["first_seen"]).strftime("%Y-%m-%d %H:%M:%S")
-        network["last_seen"] = datetime.fromtimestamp(network["last_seen"]).strftime("%Y-%m-%d %H:%M:%S")
-        network_list.append(network)
-    
-    # Add scan metadata
-    scan_data = {
-        "scan_start": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "scan_end": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "total_networks": len(networks),
-        "hidden_networks": len(hidden_networks),
-        "networks": network_list
-    }
-    
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(scan_data, f, indent=4)
+    signal_str = next((bars for threshold, bars in SIGNAL_BARS if signal > threshold), "____")
+    
+    # Build the whole line in one formatting step, with the hidden marker and colored type
+    write_output(NETWORK_LINE % (
+        network["ssid"],
+        " [HIDDEN]" if network["hidden"] else "",
+        network["bssid"],
+        network["channel"],
+        network["encryption"],
+        signal,
+        signal_str,
+        TYPE_LABELS.get(network["type"], "STANDARD")
+    ))
+
+
+def save_results(filename, quiet=False):
+    """Save scan results to a JSON file, printing the path unless quiet"""
+    # An autosave and the final save may overlap, so only one writes at a time
+    with save_lock:
+        # Print any discoveries still queued before the save messages
+        if not quiet:
+            flush_output()
+        
+        output_dir = "data"
+        os.makedirs(output_dir, exist_ok=True)
+        
+        output_path = os.path.join(output_dir, filename)
+        
+        # Convert network dict to a list for JSON serialization; copies get the formatted times.
+        # The capture keeps adding networks while an autosave runs, so iterate over a snapshot
+        network_list = []
+        for network in list(networks.values()):
+            network_list.append({
+                **network,
+                "first_seen": datetime.fromtimestamp(network["first_seen"]).strftime(TIME_FORMAT),
+                "last_seen": datetime.fromtimestamp(network["last_seen"]).strftime(TIME_FORMAT)
+            })
+        
+        # Add scan metadata
+        scan_data = {
+            "scan_start": start_time.strftime(TIME_FORMAT),
+            "scan_end": datetime.now().strftime(TIME_FORMAT),
+            "total_networks": len(network_list),
+            "hidden_networks": len(hidden_networks),
+            "networks": network_list
+        }
+        
+        # Write to file, with orjson when available
+        dump_json(scan_data, output_path)
+        
+        if not quiet:
+            print(f"\nResults saved to {output_path}")
+        return output_path
+
+
+def save_periodically():
+    """Save the results every AUTOSAVE_INTERVAL seconds, so a crash loses at most one interval"""
+    while not autosave_stop.wait(AUTOSAVE_INTERVAL):
+        with save_lock:
+            # The final save may have started while this one waited for the lock
+            if autosave_stop.is_set():
+                break
+            
+            try:
+                save_results(output_file, quiet=True)
+            except Exception as e:
+                logger.error(f"Autosave failed: {str(e)}")
+
+
+def supports_capture_filter(interface):
+    """Check whether libpcap can compile CAPTURE_FILTER for an interface"""
+    if compile_filter is None:
+        return False
     
-    print(f"\nResults saved to {output_path}")
-    return output_path
+    try:
+        compile_filter(CAPTURE_FILTER, interface)
+    except Exception:
+        return False
+    return True
 
 
 def main():
@@ -353,27 +550,45 @@ def main():
     # Initialize scan
     interface = initialize_scan(args.interface)
     
+    # Keep the results file current while the scan runs
+    threading.Thread(target=save_periodically, name="autosave", daemon=True).start()
+    
+    # Let the kernel drop every other frame type when libpcap can compile the filter
+    capture_filter = CAPTURE_FILTER if supports_capture_filter(interface) else None
+    if capture_filter is None:
+        logger.warning("Capture filter unavailable, filtering frames in Python instead")
+    
+    # Capture in the background; every exit path below stops it before the final save
+    sniffer = scapy.AsyncSniffer(
+        iface=interface,
+        prn=process_packet,
+        store=False,
+        filter=capture_filter
+    )
+    
     try:
         # Start packet capture
         print(f"Starting capture on {interface}. Press Ctrl+C to stop.")
         
-        end_time = time.time() + args.time if args.time > 0 else None
-        
-        # Start the packet capture
-        scapy.sniff(
-            iface=interface,
-            prn=process_packet,
-            store=False,
-            stop_filter=lambda _: end_time and time.time() > end_time
-        )
+        # Wait until the scan duration elapses
+        try:
+            sniffer.start()
+            sniffer.join(args.time if args.time > 0 else None)
+        finally:
+            if sniffer.running:
+                sniffer.stop()
         
         # If we get here, the scan completed due to timeout
+        flush_output()
         print("\nScan completed.")
+        autosave_stop.set()
         save_results(output_file)
         print(f"Discovered {len(networks)} networks ({len(hidden_networks)} hidden)")
     
     except KeyboardInterrupt:
+        flush_output()
         print("\nScan interrupted by user.")
+        autosave_stop.set()
         save_results(output_file)
         print(f"Discovered {len(networks)} networks ({len(hidden_networks)} hidden)")
     